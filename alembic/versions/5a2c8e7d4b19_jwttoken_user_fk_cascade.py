@@ -0,0 +1,28 @@
+"""jwttoken_user_fk_cascade
+
+Revision ID: 5a2c8e7d4b19
+Revises: 3d8f0b6c2e41
+Create Date: 2026-10-18 19:24:07.318562
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5a2c8e7d4b19'
+down_revision: Union[str, None] = '3d8f0b6c2e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint('jwttoken_user_id_fkey', 'jwttoken', type_='foreignkey')
+    op.create_foreign_key('jwttoken_user_id_fkey', 'jwttoken', 'user', ['user_id'], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('jwttoken_user_id_fkey', 'jwttoken', type_='foreignkey')
+    op.create_foreign_key('jwttoken_user_id_fkey', 'jwttoken', 'user', ['user_id'], ['id'])
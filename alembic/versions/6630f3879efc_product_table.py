@@ -0,0 +1,102 @@
+"""product_table
+
+Revision ID: 6630f3879efc
+Revises: 73dfd3164c51
+Create Date: 2026-10-18 10:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '6630f3879efc'
+down_revision: Union[str, None] = '73dfd3164c51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('product',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('marketplace', postgresql.ENUM('WILDBERRIES', 'OZON', name='marketplace', create_type=False), nullable=False),
+    sa.Column('article', sa.String(), nullable=True),
+    sa.Column('title', sa.String(), nullable=True),
+    sa.Column('image_url', sa.String(length=2048), nullable=True),
+    sa.Column('current_price', sa.Numeric(), nullable=False),
+    sa.Column('last_checked_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('id'),
+    sa.UniqueConstraint('marketplace', 'article', name='unique_marketplace_article')
+    )
+    # Один товар на пару (marketplace, article): берем самые свежие данные.
+    op.execute(
+        """
+        INSERT INTO product (
+            marketplace, article, title, image_url,
+            current_price, last_checked_at
+        )
+        SELECT DISTINCT ON (marketplace, article)
+            marketplace, article, title, image_url,
+            current_price, last_checked_at
+        FROM track
+        ORDER BY
+            marketplace, article,
+            last_checked_at DESC NULLS LAST, updated_at DESC
+        """
+    )
+    op.add_column('track', sa.Column('product_id', sa.Integer(), nullable=True))
+    op.execute(
+        """
+        UPDATE track
+        SET product_id = product.id
+        FROM product
+        WHERE product.marketplace = track.marketplace
+            AND product.article IS NOT DISTINCT FROM track.article
+        """
+    )
+    op.alter_column('track', 'product_id', nullable=False)
+    op.create_foreign_key('track_product_id_fkey', 'track', 'product', ['product_id'], ['id'])
+    op.drop_column('track', 'title')
+    op.drop_column('track', 'image_url')
+    op.drop_column('track', 'current_price')
+    op.drop_column('track', 'last_checked_at')
+    op.drop_table('user_track')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_table('user_track',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('track_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['track_id'], ['track.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('user_id', 'track_id')
+    )
+    op.add_column('track', sa.Column('last_checked_at', sa.DateTime(), nullable=True))
+    op.add_column('track', sa.Column('current_price', sa.Numeric(), nullable=True))
+    op.add_column('track', sa.Column('image_url', sa.String(length=2048), nullable=True))
+    op.add_column('track', sa.Column('title', sa.String(), nullable=True))
+    op.execute(
+        """
+        UPDATE track
+        SET
+            title = product.title,
+            image_url = product.image_url,
+            current_price = product.current_price,
+            last_checked_at = product.last_checked_at
+        FROM product
+        WHERE product.id = track.product_id
+        """
+    )
+    op.alter_column('track', 'current_price', nullable=False)
+    op.drop_constraint('track_product_id_fkey', 'track', type_='foreignkey')
+    op.drop_column('track', 'product_id')
+    op.drop_table('product')
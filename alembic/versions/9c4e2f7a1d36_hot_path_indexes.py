@@ -0,0 +1,35 @@
+"""hot_path_indexes
+
+Revision ID: 9c4e2f7a1d36
+Revises: 5a2c8e7d4b19
+Create Date: 2026-10-18 21:06:41.527310
+
+Индексы создаются через CREATE INDEX CONCURRENTLY, который нельзя
+выполнять внутри транзакции, поэтому операции вынесены
+в autocommit_block.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4e2f7a1d36'
+down_revision: Union[str, None] = '5a2c8e7d4b19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_track_user_id_marketplace', 'track', ['user_id', 'marketplace'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_track_product_id', 'track', ['product_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_pricehistory_track_id_created_at', 'pricehistory', ['track_id', 'created_at'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_pricehistory_track_id_created_at', table_name='pricehistory', postgresql_concurrently=True)
+        op.drop_index('ix_track_product_id', table_name='track', postgresql_concurrently=True)
+        op.drop_index('ix_track_user_id_marketplace', table_name='track', postgresql_concurrently=True)
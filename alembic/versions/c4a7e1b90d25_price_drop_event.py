@@ -0,0 +1,63 @@
+"""price_drop_event
+
+Revision ID: c4a7e1b90d25
+Revises: 8b2e4d6f1a93
+Create Date: 2026-10-18 14:58:33.604127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a7e1b90d25'
+down_revision: Union[str, None] = '8b2e4d6f1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('pricedropevent',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('track_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('article', sa.String(), nullable=True),
+    sa.Column('price', sa.Numeric(), nullable=False),
+    sa.Column('delivered_at', postgresql.TIMESTAMP(timezone=True), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['track_id'], ['track.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('id')
+    )
+    op.create_index('ix_pricedropevent_undelivered', 'pricedropevent', ['id'], unique=False, postgresql_where=sa.text('delivered_at IS NULL'))
+    # NOTIFY доставляется слушателям только после коммита транзакции.
+    op.execute(
+        """
+        CREATE FUNCTION notify_price_drop() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('price_drop', NEW.id::text);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER price_drop_notify
+        AFTER INSERT ON pricedropevent
+        FOR EACH ROW EXECUTE FUNCTION notify_price_drop()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER price_drop_notify ON pricedropevent')
+    op.execute('DROP FUNCTION notify_price_drop()')
+    op.drop_index('ix_pricedropevent_undelivered', table_name='pricedropevent', postgresql_where=sa.text('delivered_at IS NULL'))
+    op.drop_table('pricedropevent')
@@ -0,0 +1,47 @@
+"""price_drop_outbox
+
+Revision ID: e91d3c5a7f08
+Revises: c4a7e1b90d25
+Create Date: 2026-10-18 16:20:44.118306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'e91d3c5a7f08'
+down_revision: Union[str, None] = 'c4a7e1b90d25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('pricedropevent', sa.Column('idempotency_key', sa.String(), nullable=True))
+    op.add_column('pricedropevent', sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('pricedropevent', sa.Column('next_attempt_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False))
+    op.add_column('pricedropevent', sa.Column('last_error', sa.String(), nullable=True))
+    op.execute(
+        """
+        UPDATE pricedropevent
+        SET idempotency_key = 'price_drop:event:' || id
+        """
+    )
+    op.alter_column('pricedropevent', 'idempotency_key', nullable=False)
+    op.create_unique_constraint('pricedropevent_idempotency_key_key', 'pricedropevent', ['idempotency_key'])
+    op.drop_index('ix_pricedropevent_undelivered', table_name='pricedropevent', postgresql_where=sa.text('delivered_at IS NULL'))
+    op.create_index('ix_pricedropevent_undelivered', 'pricedropevent', ['next_attempt_at'], unique=False, postgresql_where=sa.text('delivered_at IS NULL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_pricedropevent_undelivered', table_name='pricedropevent', postgresql_where=sa.text('delivered_at IS NULL'))
+    op.create_index('ix_pricedropevent_undelivered', 'pricedropevent', ['id'], unique=False, postgresql_where=sa.text('delivered_at IS NULL'))
+    op.drop_constraint('pricedropevent_idempotency_key_key', 'pricedropevent', type_='unique')
+    op.drop_column('pricedropevent', 'last_error')
+    op.drop_column('pricedropevent', 'next_attempt_at')
+    op.drop_column('pricedropevent', 'attempts')
+    op.drop_column('pricedropevent', 'idempotency_key')
@@ -0,0 +1,13 @@
+"""Модуль с настройками подключения бота к БД."""
+
+import os
+
+
+def get_database_dsn() -> str:
+    """Собирает DSN базы данных из переменных окружения."""
+    return (
+        f'postgresql://{os.getenv("POSTGRES_USER")}:'
+        f'{os.getenv("POSTGRES_PASSWORD")}@'
+        f'{os.getenv("POSTGRES_HOST")}:{os.getenv("POSTGRES_PORT")}'
+        f'/{os.getenv("POSTGRES_DB")}'
+    )
@@ -26,11 +26,20 @@ GET_TRACK_BY_ARTICLE_AND_MARKETPLACE = (
 DELETE_TRACK_BY_ID = f'{PROTOCOL}://{DOMEN}/tracks/{{id}}'
 UPDATE_TRACK_BY_ID = f'{PROTOCOL}://{DOMEN}/tracks/{{id}}'
 REFRESH_DATA_FOR_EXISTEN_TRACK = f'{PROTOCOL}://{DOMEN}/tracks/refresh/{{id}}'
+REFRESH_USERS_TRACKS = f'{PROTOCOL}://{DOMEN}/tracks/refresh'
 
 # Эндпоинты PriceHistory
 GET_TRACKS_PRICE_HISTORY = f'{PROTOCOL}://{DOMEN}/price-history/{{track_id}}'
 ADD_ENTRY_ABOUT_TRACK = f'{PROTOCOL}://{DOMEN}/price-history/{{track_id}}'
 
+# Эндпоинты Notification
+NOTIFICATION_SUBSCRIPTION = (
+    f'{PROTOCOL}://{DOMEN}/notifications/subscription'
+)
+NOTIFICATION_SUBSCRIPTIONS = (
+    f'{PROTOCOL}://{DOMEN}/notifications/subscriptions'
+)
+
 # Эндпоинты Media
 GET_USER_MEDIA = f'{PROTOCOL}://{DOMEN}/media/avatar/{{media_id}}'
 ADD_NEW_AVATAR = f'{PROTOCOL}://{DOMEN}/media/upload-avatar'
@@ -11,8 +11,9 @@ from bot.handlers.pre_process import (clear_messages,
                                       load_data_for_register_user)
 from bot.handlers.utils import (catch_error, check_authorization,
                                 get_interaction, send_tracked_message)
-from bot.scheduler import (PERIODIC_CHECK_FIRST, PERIODIC_CHECK_INTERVAL,
-                           periodic_check)
+from bot.scheduler import (get_first_check_delay,
+                           save_notification_subscription,
+                           schedule_price_check)
 
 MESSAGE_HANDLERS = filters.TEXT & ~filters.COMMAND
 
@@ -119,16 +120,22 @@ async def start_notifications(
     await query.answer()
     if not await check_authorization(query, context):
         return
-    context.job_queue.run_repeating(
-        periodic_check,
-        interval=PERIODIC_CHECK_INTERVAL,
-        first=PERIODIC_CHECK_FIRST,
-        name=f'price_check_{query.message.chat.id}',
-        data=dict(
-            jwt_token=context.user_data['account']['jwt_token'],
-            chat_id=query.from_user.id
-        )
+    jwt_token = context.user_data['account']['jwt_token']
+    subscription = await save_notification_subscription(
+        jwt_token, query.message.chat.id
     )
+    # Проверки запускает только лидер, остальные реплики
+    # передают ему подписку через API.
+    if context.bot_data['leader_election'].is_leader:
+        schedule_price_check(
+            context.job_queue,
+            query.message.chat.id,
+            jwt_token,
+            interval=subscription['interval'],
+            first=get_first_check_delay(
+                subscription['user_id'], subscription['interval']
+            )
+        )
     await send_tracked_message(
         query,
         context,
@@ -0,0 +1,117 @@
+"""Модуль с выбором лидера среди реплик бота."""
+
+import asyncio
+from typing import Awaitable, Callable
+
+import asyncpg
+
+from bot.database import get_database_dsn
+
+# Ключ advisory-блокировки планировщика проверок цен.
+SCHEDULER_LOCK_ID = 7_340_021
+
+RECONNECT_DELAY = 5
+RENEW_INTERVAL = 5
+
+# Postgres обнаружит пропавшего лидера и снимет блокировку
+# примерно за tcp_keepalives_idle + interval * count секунд.
+KEEPALIVE_SERVER_SETTINGS = dict(
+    tcp_keepalives_idle='5',
+    tcp_keepalives_interval='2',
+    tcp_keepalives_count='3'
+)
+
+
+class LeaderElection:
+    """
+    Выбор лидера через сессионную advisory-блокировку Postgres.
+
+    Блокировка держится на отдельном соединении, пока оно живо.
+    Реплики без блокировки пытаются захватить ее раз в RENEW_INTERVAL
+    секунд. Лидер проверяет соединение с той же периодичностью
+    и при ошибке перестает считать себя лидером.
+
+    Если лидер остановился штатно, блокировка снимается сразу вместе
+    с соединением, и новый лидер выбирается не позже чем через
+    RENEW_INTERVAL секунд. В худшем случае (лидер пропал без закрытия
+    соединения) Postgres снимает блокировку по keepalive примерно
+    за 5 + 2 * 3 = 11 секунд, и смена лидера занимает до
+    11 + RENEW_INTERVAL = 16 секунд.
+    """
+
+    def __init__(
+        self,
+        on_elected: Callable[[], Awaitable[None]],
+        on_demoted: Callable[[], Awaitable[None]],
+        lock_id: int = SCHEDULER_LOCK_ID
+    ) -> None:
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.lock_id = lock_id
+        self.is_leader = False
+        self._task = None
+
+    def start(self) -> None:
+        """Запускает выбор лидера в фоне."""
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Останавливает выбор лидера и снимает лидерство."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _set_leader(self, is_leader: bool) -> None:
+        if is_leader == self.is_leader:
+            return
+        self.is_leader = is_leader
+        try:
+            if is_leader:
+                await self.on_elected()
+            else:
+                await self.on_demoted()
+        except Exception as error:
+            print(f'Ошибка при смене лидера: {error}')
+
+    async def run(self) -> None:
+        """Захватывает и удерживает блокировку лидера."""
+        while True:
+            try:
+                connection = await asyncpg.connect(
+                    get_database_dsn(),
+                    server_settings=KEEPALIVE_SERVER_SETTINGS
+                )
+            except (OSError, asyncpg.PostgresError) as error:
+                print(f'Ошибка подключения к БД: {error}')
+                await asyncio.sleep(RECONNECT_DELAY)
+                continue
+            try:
+                await self.hold_lock(connection)
+            except (
+                OSError,
+                asyncio.TimeoutError,
+                asyncpg.PostgresError,
+                asyncpg.InterfaceError
+            ) as error:
+                print(f'Блокировка лидера потеряна: {error}')
+            finally:
+                await self._set_leader(False)
+                connection.terminate()
+
+    async def hold_lock(self, connection: asyncpg.Connection) -> None:
+        """Ждет блокировку и продлевает лидерство, пока соединение живо."""
+        while not await connection.fetchval(
+            'SELECT pg_try_advisory_lock($1)', self.lock_id
+        ):
+            await asyncio.sleep(RENEW_INTERVAL)
+        await self._set_leader(True)
+        while True:
+            await asyncio.sleep(RENEW_INTERVAL)
+            await asyncio.wait_for(
+                connection.fetchval('SELECT 1'), timeout=RENEW_INTERVAL
+            )
@@ -1,11 +1,17 @@
+import asyncio
 import os
+import signal
+from functools import partial
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from dotenv import load_dotenv
-from telegram.ext import ApplicationBuilder
+from telegram.ext import Application, ApplicationBuilder
 
 from bot.handlers import (base_installer_handlers, track_handler_installer,
                           user_installer_handlers)
+from bot.leader import LeaderElection
+from bot.outbox import NotificationOutboxWorker
+from bot.scheduler import start_scheduler, stop_scheduler
 
 
 load_dotenv()
@@ -13,6 +19,82 @@ load_dotenv()
 
 scheduler = AsyncIOScheduler()
 
+STOP_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+async def start_leader_services(application: Application):
+    """
+    Запускает на реплике-лидере получение обновлений, проверки цен
+    и доставку уведомлений.
+
+    Telegram допускает только одного потребителя getUpdates на токен,
+    поэтому обработчики команд работают только на лидере, остальные
+    реплики находятся в резерве. Обновления, которые прежний лидер
+    не успел подтвердить, Telegram отдаст новому лидеру.
+    Лимиты Telegram на отправку сообщений воркер outbox учитывает
+    в памяти процесса, поэтому он тоже работает только на лидере.
+    """
+    await application.updater.start_polling()
+    await start_scheduler(application)
+    application.bot_data['outbox_worker'] = NotificationOutboxWorker(
+        application.bot
+    )
+    application.bot_data['outbox_worker'].start()
+
+
+async def stop_outbox_worker(application: Application):
+    """Останавливает доставку уведомлений, если она запущена."""
+    outbox_worker = application.bot_data.pop('outbox_worker', None)
+    if outbox_worker is not None:
+        await outbox_worker.stop()
+
+
+async def stop_leader_services(application: Application):
+    """Останавливает получение обновлений, проверки цен и доставку."""
+    if application.updater.running:
+        await application.updater.stop()
+    await stop_outbox_worker(application)
+    await stop_scheduler(application)
+
+
+async def post_init(application: Application):
+    application.bot_data['leader_election'] = LeaderElection(
+        on_elected=partial(start_leader_services, application),
+        on_demoted=partial(stop_leader_services, application)
+    )
+    application.bot_data['leader_election'].start()
+
+
+async def post_shutdown(application: Application):
+    leader_election = application.bot_data.get('leader_election')
+    if leader_election is not None:
+        await leader_election.stop()
+    await stop_outbox_worker(application)
+    if application.updater.running:
+        await application.updater.stop()
+
+
+async def run_bot(application: Application):
+    """
+    Запускает бота до получения SIGINT или SIGTERM.
+
+    Вместо run_polling получение обновлений запускает и останавливает
+    выбор лидера (start_leader_services), поэтому жизненный цикл
+    приложения ведется вручную.
+    """
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for stop_signal in STOP_SIGNALS:
+        loop.add_signal_handler(stop_signal, stop_event.set)
+    async with application:
+        await application.start()
+        await post_init(application)
+        try:
+            await stop_event.wait()
+        finally:
+            await post_shutdown(application)
+            await application.stop()
+
 
 def main():
     application = ApplicationBuilder().token(
@@ -21,7 +103,7 @@ def main():
     base_installer_handlers(application)
     user_installer_handlers(application)
     track_handler_installer(application)
-    application.run_polling()
+    asyncio.run(run_bot(application))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,290 @@
+"""Модуль с воркером доставки уведомлений из outbox в Postgres."""
+
+import asyncio
+import time
+
+import asyncpg
+from telegram import Bot
+from telegram.error import RetryAfter
+
+from bot.database import get_database_dsn
+
+PRICE_DROP_CHANNEL = 'price_drop'
+
+RECONNECT_DELAY = 5
+POLL_INTERVAL = 10
+DELIVERY_BATCH_SIZE = 100
+DELIVERY_LEASE = 60
+LEASE_RENEW_INTERVAL = DELIVERY_LEASE / 3
+MAX_DELIVERY_ATTEMPTS = 10
+RETRY_BASE_DELAY = 5
+RETRY_MAX_DELAY = 60 * 60
+NOTIFICATION_SEND_TIMEOUT = 10
+
+# Ограничения Telegram Bot API на отправку сообщений.
+GLOBAL_MESSAGES_PER_SECOND = 30
+CHAT_MESSAGE_INTERVAL = 1
+CHAT_SLOTS_CLEANUP_SIZE = 1000
+
+SUCCESS_PRICE = '🎉 Цена на товар {article} опустилась до нужной!'
+
+CLAIM_EVENTS = """
+    WITH claimed AS (
+        SELECT event.id
+        FROM pricedropevent AS event
+        JOIN notificationsubscription AS subscription
+            ON subscription.user_id = event.user_id
+        WHERE event.delivered_at IS NULL
+            AND event.next_attempt_at <= now()
+            AND event.attempts < $2
+            AND subscription.enabled
+        ORDER BY event.next_attempt_at, event.id
+        LIMIT $1
+        FOR UPDATE OF event SKIP LOCKED
+    )
+    UPDATE pricedropevent AS event
+    SET
+        attempts = event.attempts + 1,
+        next_attempt_at = now() + make_interval(secs => $3)
+    FROM claimed, notificationsubscription AS subscription
+    WHERE event.id = claimed.id
+        AND subscription.user_id = event.user_id
+    RETURNING
+        event.id, event.article, event.attempts,
+        event.idempotency_key, subscription.chat_id
+"""
+RENEW_EVENTS_LEASE = """
+    UPDATE pricedropevent
+    SET next_attempt_at = now() + make_interval(secs => $2)
+    WHERE id = ANY($1::int[]) AND delivered_at IS NULL
+"""
+MARK_EVENTS_DELIVERED = """
+    UPDATE pricedropevent
+    SET delivered_at = now(), last_error = NULL
+    WHERE id = ANY($1::int[]) AND delivered_at IS NULL
+"""
+POSTPONE_EVENT = """
+    UPDATE pricedropevent
+    SET
+        next_attempt_at = now() + make_interval(secs => $2),
+        last_error = $3
+    WHERE id = $1
+"""
+
+
+def get_retry_delay(attempts: int) -> float:
+    """Экспоненциальная задержка перед повторной отправкой."""
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempts - 1))
+
+
+class DeliveryRateLimiter:
+    """
+    Планировщик отправок с учетом лимитов Telegram.
+
+    Каждой отправке назначается слот не раньше следующего свободного
+    глобального слота (GLOBAL_MESSAGES_PER_SECOND) и слота чата
+    (CHAT_MESSAGE_INTERVAL). Пауза после RetryAfter проверяется перед
+    каждой отправкой: слот, наступивший во время паузы, назначается
+    заново после нее.
+    Лимиты хранятся в памяти процесса, поэтому воркер доставки
+    запускается только на реплике-лидере. Прошедшие слоты чатов
+    удаляются, как только их набирается CHAT_SLOTS_CLEANUP_SIZE.
+    """
+
+    def __init__(
+        self,
+        messages_per_second: float = GLOBAL_MESSAGES_PER_SECOND,
+        chat_interval: float = CHAT_MESSAGE_INTERVAL
+    ) -> None:
+        self.global_interval = 1 / messages_per_second
+        self.chat_interval = chat_interval
+        self._next_global_slot = 0.0
+        self._next_chat_slots: dict[int, float] = dict()
+        self._paused_until = 0.0
+
+    async def wait(self, chat_id: int) -> None:
+        """Дожидается слота для отправки сообщения в чат."""
+        if len(self._next_chat_slots) >= CHAT_SLOTS_CLEANUP_SIZE:
+            self.cleanup()
+        while True:
+            now = time.monotonic()
+            slot = max(
+                now,
+                self._next_global_slot,
+                self._next_chat_slots.get(chat_id, 0.0)
+            )
+            self._next_global_slot = slot + self.global_interval
+            self._next_chat_slots[chat_id] = slot + self.chat_interval
+            if slot > now:
+                await asyncio.sleep(slot - now)
+            if time.monotonic() >= self._paused_until:
+                return
+
+    def pause(self, delay: float) -> None:
+        """Приостанавливает все отправки (ответ RetryAfter)."""
+        self._paused_until = max(
+            self._paused_until, time.monotonic() + delay
+        )
+        self._next_global_slot = max(
+            self._next_global_slot, self._paused_until
+        )
+
+    def cleanup(self) -> None:
+        """Удаляет прошедшие слоты чатов."""
+        now = time.monotonic()
+        self._next_chat_slots = {
+            chat_id: slot
+            for chat_id, slot in self._next_chat_slots.items()
+            if slot > now
+        }
+
+
+class NotificationOutboxWorker:
+    """
+    Воркер доставки уведомлений о снижении цены.
+
+    Забирает из outbox пачки недоставленных уведомлений
+    (FOR UPDATE SKIP LOCKED) и отправляет их с учетом лимитов Telegram.
+    Забранное уведомление скрыто от других воркеров на DELIVERY_LEASE
+    секунд, пока пачка отправляется, аренда продлевается раз
+    в LEASE_RENEW_INTERVAL секунд: отправка пачки в один чат
+    (CHAT_MESSAGE_INTERVAL) или пауза после RetryAfter может длиться
+    дольше аренды. Если воркер упадет, уведомление будет отправлено
+    повторно.
+    Неудачные отправки повторяются с экспоненциальной задержкой.
+    NOTIFY из канала price_drop будит воркер сразу после коммита,
+    без него outbox проверяется раз в POLL_INTERVAL секунд.
+    """
+
+    def __init__(self, bot: Bot) -> None:
+        self.bot = bot
+        self.rate_limiter = DeliveryRateLimiter()
+        self._wakeup = asyncio.Event()
+        self._task = None
+
+    def start(self) -> None:
+        """Запускает воркер в фоне."""
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Останавливает воркер."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        self._wakeup.set()
+
+    async def run(self) -> None:
+        """Доставляет уведомления, переподключаясь при разрыве."""
+        while True:
+            try:
+                connection = await asyncpg.connect(get_database_dsn())
+            except (OSError, asyncpg.PostgresError) as error:
+                print(f'Ошибка подключения к БД: {error}')
+                await asyncio.sleep(RECONNECT_DELAY)
+                continue
+            try:
+                await connection.add_listener(
+                    PRICE_DROP_CHANNEL, self._on_notification
+                )
+                while True:
+                    self._wakeup.clear()
+                    delivered = await self.deliver_batch(connection)
+                    if delivered == DELIVERY_BATCH_SIZE:
+                        continue
+                    try:
+                        await asyncio.wait_for(
+                            self._wakeup.wait(), timeout=POLL_INTERVAL
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+            except (
+                OSError, asyncpg.PostgresError, asyncpg.InterfaceError
+            ) as error:
+                print(f'Соединение с outbox потеряно: {error}')
+            finally:
+                await connection.close()
+            await asyncio.sleep(RECONNECT_DELAY)
+
+    async def deliver_batch(self, connection: asyncpg.Connection) -> int:
+        """Забирает и отправляет пачку уведомлений."""
+        events = await connection.fetch(
+            CLAIM_EVENTS,
+            DELIVERY_BATCH_SIZE,
+            MAX_DELIVERY_ATTEMPTS,
+            DELIVERY_LEASE
+        )
+        if not events:
+            return 0
+        sent = asyncio.Event()
+        renewal = asyncio.create_task(self.renew_lease(
+            connection, [event['id'] for event in events], sent
+        ))
+        try:
+            results = await asyncio.gather(
+                *[self.send(event) for event in events],
+                return_exceptions=True
+            )
+        finally:
+            sent.set()
+            await renewal
+        delivered_ids = list()
+        for event, result in zip(events, results):
+            if result is None:
+                delivered_ids.append(event['id'])
+                continue
+            delay = get_retry_delay(event['attempts'])
+            if isinstance(result, RetryAfter):
+                delay = max(delay, result.retry_after)
+            await connection.execute(
+                POSTPONE_EVENT, event['id'], delay, repr(result)
+            )
+        if delivered_ids:
+            await connection.execute(MARK_EVENTS_DELIVERED, delivered_ids)
+        self.rate_limiter.cleanup()
+        return len(events)
+
+    async def renew_lease(
+        self,
+        connection: asyncpg.Connection,
+        event_ids: list[int],
+        sent: asyncio.Event
+    ) -> None:
+        """
+        Продлевает аренду забранных уведомлений до конца отправки.
+
+        Запрос не отменяется посреди выполнения, чтобы соединение
+        осталось пригодным для отметки результатов.
+        """
+        while True:
+            try:
+                await asyncio.wait_for(
+                    sent.wait(), timeout=LEASE_RENEW_INTERVAL
+                )
+                return
+            except asyncio.TimeoutError:
+                pass
+            await connection.execute(
+                RENEW_EVENTS_LEASE, event_ids, DELIVERY_LEASE
+            )
+
+    async def send(self, event: asyncpg.Record) -> None:
+        """Отправляет одно уведомление."""
+        await self.rate_limiter.wait(event['chat_id'])
+        try:
+            await asyncio.wait_for(
+                self.bot.send_message(
+                    chat_id=event['chat_id'],
+                    text=SUCCESS_PRICE.format(article=event['article'])
+                ),
+                timeout=NOTIFICATION_SEND_TIMEOUT
+            )
+        except RetryAfter as error:
+            self.rate_limiter.pause(error.retry_after)
+            raise
@@ -1,33 +1,315 @@
-from decimal import Decimal
+import hashlib
+import os
+import random
+from collections import Counter
+from datetime import datetime, timezone
 from http import HTTPStatus
+from math import ceil
 
 import aiohttp
-from telegram.ext import ContextTypes
+from telegram.ext import Application, ContextTypes, Job, JobQueue
 
-from bot.endpoints import (ADD_ENTRY_ABOUT_TRACK,
-                           REFRESH_DATA_FOR_EXISTEN_TRACK, UPDATE_TRACK_BY_ID,
-                           USERS_TRACKS)
+from bot.endpoints import (GET_JWT_TOKEN, NOTIFICATION_SUBSCRIPTION,
+                           NOTIFICATION_SUBSCRIPTIONS, REFRESH_USERS_TRACKS)
+from bot.handlers.utils import decode_jwt_token
 
 
 PERIODIC_CHECK_INTERVAL = 3
 PERIODIC_CHECK_FIRST = 1
+PERIODIC_CHECK_JOB_NAME = 'price_check_{chat_id}'
+PERIODIC_CHECK_JOB_PREFIX = 'price_check_'
+
+# Режимы распределения первых запусков проверок:
+# fixed - все проверки стартуют через PERIODIC_CHECK_FIRST,
+# random - случайное смещение в пределах интервала,
+# spread - смещение по стабильному хэшу id пользователя и jitter.
+FIXED_SCHEDULING = 'fixed'
+RANDOM_SCHEDULING = 'random'
+SPREAD_SCHEDULING = 'spread'
+PERIODIC_CHECK_SCHEDULING = os.getenv(
+    'PERIODIC_CHECK_SCHEDULING', SPREAD_SCHEDULING
+)
+PERIODIC_CHECK_JITTER = float(os.getenv('PERIODIC_CHECK_JITTER', '0.1'))
+
+RESTORE_SUBSCRIPTIONS_BATCH_SIZE = 100
+RESYNC_SUBSCRIPTIONS_INTERVAL = 60
+RESYNC_SUBSCRIPTIONS_JOB_NAME = 'resync_subscriptions'
+
+# Список подписок с токенами пользователей доступен только
+# суперпользователю: бот входит под первым суперпользователем API.
+SERVICE_USER_EMAIL = os.getenv('FIRST_SUPERUSER_EMAIL')
+SERVICE_USER_PASSWORD = os.getenv('FIRST_SUPERUSER_PASSWORD')
+SERVICE_TOKEN_KEY = 'service_jwt_token'
+# Токены, которые API отклонил с 401, по chat_id: проверка по такому
+# токену не восстанавливается, пока пользователь не войдет заново.
+REJECTED_TOKENS_KEY = 'rejected_jwt_tokens'
 
-SUCCESS_PRICE = '🎉 Цена на товар {article} опустилась до нужной!'
 TOKEN_LIFETIME_ERROR = '⛔ Срок действия токена истёк. Авторизуйтесь снова.'
 GETTING_DATA_ERROR = (
     '⛔ Ошибка получения данных: код ошибки {status_code}'
 )
 
 
+LOAD_PROFILE_REPORT = (
+    'Профиль нагрузки проверок: {jobs} задач, '
+    'в среднем {mean:.2f}/с, максимум {peak}/с'
+)
+
+
 async def periodic_check(context: ContextTypes.DEFAULT_TYPE):
     await check_prices_and_notify_users(context)
 
 
+def get_stable_fraction(key: int) -> float:
+    """Стабильное между перезапусками число из [0, 1) по ключу."""
+    digest = hashlib.blake2b(str(key).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') / 2 ** 64
+
+
+def get_first_check_delay(
+    user_id: int,
+    interval: int = PERIODIC_CHECK_INTERVAL,
+    mode: str = PERIODIC_CHECK_SCHEDULING
+) -> float:
+    """
+    Возвращает задержку первого запуска проверки пользователя.
+
+    В режиме spread проверки равномерно распределяются по окну
+    интервала: смещение определяется хэшем user_id и не меняется
+    между перезапусками, jitter (доля интервала) дополнительно
+    разводит пользователей с близкими смещениями.
+    """
+    if mode == FIXED_SCHEDULING:
+        return PERIODIC_CHECK_FIRST
+    if mode == RANDOM_SCHEDULING:
+        return PERIODIC_CHECK_FIRST + random.uniform(0, interval)
+    offset = get_stable_fraction(user_id) * interval
+    jitter = random.uniform(
+        -PERIODIC_CHECK_JITTER, PERIODIC_CHECK_JITTER
+    ) * interval
+    return PERIODIC_CHECK_FIRST + (offset + jitter) % interval
+
+
+def get_price_check_jobs(job_queue: JobQueue) -> list[Job]:
+    """Возвращает запланированные проверки цен."""
+    return [
+        job for job in job_queue.jobs()
+        if job.name.startswith(PERIODIC_CHECK_JOB_PREFIX)
+        and job.next_t is not None
+    ]
+
+
+def get_load_profile(job_queue: JobQueue) -> Counter:
+    """
+    Считает число запусков проверок по секундам ближайшего окна.
+
+    Окно равно наибольшему интервалу среди проверок, секунды
+    без запусков входят в профиль с нулем.
+    """
+    jobs = get_price_check_jobs(job_queue)
+    profile = Counter()
+    if not jobs:
+        return profile
+    now = datetime.now(timezone.utc)
+    window = max(job.job.trigger.interval.total_seconds() for job in jobs)
+    profile.update({second: 0 for second in range(ceil(window))})
+    for job in jobs:
+        interval = job.job.trigger.interval.total_seconds()
+        run_at = (job.next_t - now).total_seconds()
+        while run_at < window:
+            profile[max(0, int(run_at))] += 1
+            run_at += interval
+    return profile
+
+
+def report_load_profile(job_queue: JobQueue) -> str:
+    """Формирует отчет о распределении проверок по секундам."""
+    profile = get_load_profile(job_queue)
+    return LOAD_PROFILE_REPORT.format(
+        jobs=len(get_price_check_jobs(job_queue)),
+        mean=sum(profile.values()) / max(len(profile), 1),
+        peak=max(profile.values(), default=0)
+    )
+
+
+def schedule_price_check(
+    job_queue: JobQueue,
+    chat_id: int,
+    jwt_token: str,
+    interval: int = PERIODIC_CHECK_INTERVAL,
+    first: float = PERIODIC_CHECK_FIRST
+):
+    """
+    Запускает периодическую проверку цен для чата.
+
+    Ранее запущенная проверка этого чата удаляется,
+    чтобы не дублировать уведомления.
+    """
+    name = PERIODIC_CHECK_JOB_NAME.format(chat_id=chat_id)
+    for job in job_queue.get_jobs_by_name(name):
+        job.schedule_removal()
+    return job_queue.run_repeating(
+        periodic_check,
+        interval=interval,
+        first=first,
+        name=name,
+        data=dict(
+            jwt_token=jwt_token,
+            chat_id=chat_id
+        )
+    )
+
+
+async def save_notification_subscription(
+    jwt_token: str,
+    chat_id: int,
+    interval: int = PERIODIC_CHECK_INTERVAL,
+    enabled: bool = True
+):
+    """Сохраняет подписку на уведомления в API."""
+    async with aiohttp.ClientSession() as session:
+        async with session.put(
+            NOTIFICATION_SUBSCRIPTION,
+            headers=dict(Authorization=f'Bearer {jwt_token}'),
+            json=dict(chat_id=chat_id, interval=interval, enabled=enabled)
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+
+async def get_service_token(
+    session: aiohttp.ClientSession,
+    application: Application,
+    refresh: bool = False
+) -> str:
+    """
+    Возвращает JWT суперпользователя для служебных запросов бота.
+
+    Токен хранится в bot_data и запрашивается заново, если его нет
+    или API ответил 401.
+    """
+    if refresh or SERVICE_TOKEN_KEY not in application.bot_data:
+        async with session.post(
+            GET_JWT_TOKEN,
+            data=dict(
+                grant_type='password',
+                username=SERVICE_USER_EMAIL,
+                password=SERVICE_USER_PASSWORD,
+                scope=''
+            )
+        ) as response:
+            response.raise_for_status()
+            application.bot_data[SERVICE_TOKEN_KEY] = (
+                await response.json()
+            )['access_token']
+    return application.bot_data[SERVICE_TOKEN_KEY]
+
+
+async def get_subscriptions_page(
+    session: aiohttp.ClientSession,
+    application: Application,
+    offset: int
+) -> list[dict]:
+    """Загружает страницу включенных подписок от имени суперпользователя."""
+    for refresh in (False, True):
+        token = await get_service_token(session, application, refresh)
+        async with session.get(
+            NOTIFICATION_SUBSCRIPTIONS,
+            headers=dict(Authorization=f'Bearer {token}'),
+            params=dict(
+                offset=offset, limit=RESTORE_SUBSCRIPTIONS_BATCH_SIZE
+            )
+        ) as response:
+            if response.status == HTTPStatus.UNAUTHORIZED and not refresh:
+                continue
+            response.raise_for_status()
+            return await response.json()
+
+
+async def restore_notifications(application: Application):
+    """
+    Восстанавливает периодические проверки по подпискам из API.
+
+    Подписки загружаются из API страницами. Первые запуски проверок
+    распределяются по интервалу (get_first_check_delay), чтобы
+    проверки всех пользователей не стартовали одновременно.
+    У уже запущенных проверок обновляется только токен. Проверки
+    с токеном, отклоненным API, не восстанавливаются.
+    """
+    rejected_tokens = application.bot_data.setdefault(
+        REJECTED_TOKENS_KEY, {}
+    )
+    offset = 0
+    async with aiohttp.ClientSession() as session:
+        while True:
+            subscriptions = await get_subscriptions_page(
+                session, application, offset
+            )
+            for subscription in subscriptions:
+                if not subscription['access_token']:
+                    continue
+                jwt_token = decode_jwt_token(subscription['access_token'])
+                if rejected_tokens.get(subscription['chat_id']) == jwt_token:
+                    continue
+                rejected_tokens.pop(subscription['chat_id'], None)
+                jobs = application.job_queue.get_jobs_by_name(
+                    PERIODIC_CHECK_JOB_NAME.format(
+                        chat_id=subscription['chat_id']
+                    )
+                )
+                if jobs:
+                    jobs[0].data['jwt_token'] = jwt_token
+                    continue
+                schedule_price_check(
+                    application.job_queue,
+                    chat_id=subscription['chat_id'],
+                    jwt_token=jwt_token,
+                    interval=subscription['interval'],
+                    first=get_first_check_delay(
+                        subscription['user_id'], subscription['interval']
+                    )
+                )
+            if len(subscriptions) < RESTORE_SUBSCRIPTIONS_BATCH_SIZE:
+                break
+            offset += RESTORE_SUBSCRIPTIONS_BATCH_SIZE
+    print(report_load_profile(application.job_queue))
+
+
+async def resync_notifications(context: ContextTypes.DEFAULT_TYPE):
+    await restore_notifications(context.application)
+
+
+async def start_scheduler(application: Application):
+    """
+    Запускает периодические проверки на реплике-лидере.
+
+    Проверки восстанавливаются сразу, а подписки, сохраненные
+    другими репликами, подхватываются раз в
+    RESYNC_SUBSCRIPTIONS_INTERVAL секунд.
+    """
+    application.job_queue.run_repeating(
+        resync_notifications,
+        interval=RESYNC_SUBSCRIPTIONS_INTERVAL,
+        first=0,
+        name=RESYNC_SUBSCRIPTIONS_JOB_NAME
+    )
+
+
+async def stop_scheduler(application: Application):
+    """Останавливает все периодические задачи реплики."""
+    for job in application.job_queue.jobs():
+        job.schedule_removal()
+
+
 async def check_prices_and_notify_users(
     context: ContextTypes.DEFAULT_TYPE
 ):
     """
-    Функция для оповещения пользователей о понижении цены до target_price.
+    Функция для периодического обновления цен товаров пользователя.
+
+    Все товары пользователя обновляются одним запросом к API.
+    Уведомления о снижении цены до target_price отправляет
+    NotificationOutboxWorker по событиям из БД.
     """
     data = context.job.data
     jwt_token = data.get('jwt_token')
@@ -40,11 +322,14 @@ async def check_prices_and_notify_users(
         headers = dict(
             Authorization=f'Bearer {jwt_token}'
         )
-        async with session.get(
-            USERS_TRACKS,
+        async with session.post(
+            REFRESH_USERS_TRACKS,
             headers=headers
         ) as response:
             if response.status == HTTPStatus.UNAUTHORIZED:
+                context.bot_data.setdefault(
+                    REJECTED_TOKENS_KEY, {}
+                )[chat_id] = jwt_token
                 await context.bot.send_message(
                     chat_id=chat_id,
                     text=TOKEN_LIFETIME_ERROR
@@ -58,58 +343,3 @@ async def check_prices_and_notify_users(
                         status_code=response.status
                     )
                 )
-                return
-            tracks = await response.json()
-            for track in tracks:
-                async with session.patch(
-                    REFRESH_DATA_FOR_EXISTEN_TRACK.format(id=track['id']),
-                    headers=headers
-                ) as updated_response:
-                    if updated_response.status != HTTPStatus.OK:
-                        continue
-                    updated_track = await updated_response.json()
-                if (
-                    Decimal(updated_track['target_price'])
-                    >= Decimal(updated_track['current_price'])
-                    and updated_track['notified'] is False
-                ):
-                    update_data = dict(
-                        notified=True
-                    )
-                    async with session.patch(
-                        UPDATE_TRACK_BY_ID.format(
-                            id=track['id']
-                        ),
-                        json=update_data,
-                        headers=headers
-                    ):
-                        pass
-                    await context.bot.send_message(
-                        chat_id=chat_id,
-                        text=SUCCESS_PRICE.format(
-                            article=updated_track['article']
-                        )
-                    )
-                elif (
-                    Decimal(updated_track['target_price'])
-                    <= Decimal(updated_track['current_price'])
-                    and updated_track['notified'] is True
-                ):
-                    update_data = dict(
-                        notified=False
-                    )
-                    async with session.patch(
-                        UPDATE_TRACK_BY_ID.format(
-                            id=track['id']
-                        ),
-                        json=update_data,
-                        headers=headers
-                    ):
-                        pass
-                async with session.post(
-                    ADD_ENTRY_ABOUT_TRACK.format(
-                        track_id=track['id']
-                    ),
-                    headers=headers
-                ) as response:
-                    print(response.status)
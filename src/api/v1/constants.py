@@ -1,4 +1 @@
-WILDBBERIES_PRODUCT_CARD_URL = (
-    'https://card.wb.ru/cards/v1/detail'
-    '?appType=1&curr=rub&dest=-1257786&spp=30&nm={nm_id}'
-)
+MAX_TRACKS_PRICE_HISTORY_LEN = 3
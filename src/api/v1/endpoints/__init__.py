@@ -1,4 +1,7 @@
 from src.api.v1.endpoints.media import router as media_router  # noqa
+from src.api.v1.endpoints.metrics import router as metrics_router  # noqa
+from src.api.v1.endpoints.notification import \
+    router as notification_router  # noqa
 from src.api.v1.endpoints.price_history import \
     router as price_history_router  # noqa
 from src.api.v1.endpoints.track import router as track_router  # noqa
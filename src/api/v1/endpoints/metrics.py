@@ -0,0 +1,48 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends, status
+
+from src.core.principal import principal_cache
+from src.core.user import current_superuser
+from src.database.db import engine
+from src.marketplaces.base import card_cache
+from src.models.user import User
+
+
+router = APIRouter()
+
+
+@router.get(
+    '/card-cache',
+    response_model=dict[str, Any],
+    status_code=status.HTTP_200_OK
+)
+async def get_card_cache_stats(
+    user: User = Depends(current_superuser)
+):
+    """Возвращает счетчики кэша карточек товаров."""
+    return card_cache.stats()
+
+
+@router.get(
+    '/principal-cache',
+    response_model=dict[str, Any],
+    status_code=status.HTTP_200_OK
+)
+async def get_principal_cache_stats(
+    user: User = Depends(current_superuser)
+):
+    """Возвращает счетчики кэша пользователей для авторизации."""
+    return principal_cache.stats()
+
+
+@router.get(
+    '/db-pool',
+    response_model=dict[str, Any],
+    status_code=status.HTTP_200_OK
+)
+async def get_db_pool_stats(
+    user: User = Depends(current_superuser)
+):
+    """Возвращает состояние пула соединений БД и время ожидания."""
+    return engine.pool.stats()
@@ -0,0 +1,83 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.user import LIFETIME_SECONDS, current_superuser, current_user
+from src.crud.notification import notification_subscription_crud
+from src.database.db import get_async_session
+from src.models.user import User
+from src.schemas.notification import (NotificationSubscriptionCreate,
+                                      NotificationSubscriptionDB,
+                                      NotificationSubscriptionRead,
+                                      NotificationSubscriptionUpdate)
+
+SUBSCRIPTIONS_PAGE_DEFAULT_LIMIT = 100
+SUBSCRIPTIONS_PAGE_MAX_LIMIT = 1000
+
+
+router = APIRouter()
+
+
+@router.put(
+    '/subscription',
+    response_model=NotificationSubscriptionDB,
+    status_code=status.HTTP_200_OK
+)
+async def save_notification_subscription(
+    update_schema: NotificationSubscriptionUpdate,
+    session: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_user)
+):
+    """Создает или обновляет подписку пользователя на уведомления."""
+    subscription = (
+        await notification_subscription_crud.get_subscription_by_user_id(
+            user.id, session
+        )
+    )
+    if subscription is None:
+        return await notification_subscription_crud.create(
+            NotificationSubscriptionCreate(
+                user_id=user.id, **update_schema.model_dump()
+            ),
+            session
+        )
+    return await notification_subscription_crud.update(
+        subscription, update_schema, session
+    )
+
+
+@router.get(
+    '/subscriptions',
+    response_model=list[NotificationSubscriptionRead],
+    status_code=status.HTTP_200_OK
+)
+async def get_enabled_notification_subscriptions(
+    offset: int = Query(0, ge=0),
+    limit: int = Query(
+        SUBSCRIPTIONS_PAGE_DEFAULT_LIMIT,
+        gt=0,
+        le=SUBSCRIPTIONS_PAGE_MAX_LIMIT
+    ),
+    session: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_superuser)
+):
+    """
+    Возвращает страницу включенных подписок на уведомления.
+
+    Ответ содержит токены пользователей, поэтому эндпоинт доступен
+    только суперпользователю. Используется ботом для восстановления
+    проверок после перезапуска. Подписки с истекшим токеном
+    пользователя не возвращаются.
+    """
+    return [
+        NotificationSubscriptionRead(
+            **NotificationSubscriptionDB.model_validate(
+                subscription
+            ).model_dump(),
+            access_token=access_token
+        )
+        for subscription, access_token in (
+            await notification_subscription_crud.get_enabled_with_tokens(
+                offset, limit, LIFETIME_SECONDS, session
+            )
+        )
+    ]
@@ -1,17 +1,17 @@
-import aiohttp
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.v1.utils import WILDBBERIES_PRODUCT_CARD_URL
+from src.api.v1.utils import claim_products, refresh_tracks
+from src.api.v1.validators import check_marketplace_supported
 from src.core.user import current_user
 from src.crud.price_history import price_history_crud
-from src.crud.track import track_crud
+from src.crud.refresh_task import refresh_task_crud
+from src.crud.track import TRACK_WITH_HISTORY_OPTIONS, track_crud
 from src.database.db import get_async_session
+from src.marketplaces.registry import marketplace_registry
 from src.models.user import User
 from src.schemas.price_history import PriceHistoryCreate, PriceHistoryDB
 
-MAX_TRACKS_PRICE_HISTORY_LEN = 3
-
 
 router = APIRouter()
 
@@ -26,6 +26,7 @@ async def get_price_history_by_track_id(
     user: User = Depends(current_user)
 ):
     """Возвращает историю товара."""
+    await track_crud.get_or_404(track_id, session, owner_id=user.id)
     return await price_history_crud.get_history_by_track_id(track_id, session)
 
 
@@ -38,19 +39,33 @@ async def add_entry_about_track(
     session: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_user)
 ):
-    """Создает запись в истории товара."""
-    track = await track_crud.get(track_id, session)
-    if len(track.price_history) >= MAX_TRACKS_PRICE_HISTORY_LEN:
-        await price_history_crud.delete_the_oldest_price_history(session)
-    async with aiohttp.ClientSession() as local_session:
-        async with local_session.get(
-            WILDBBERIES_PRODUCT_CARD_URL.format(
-                nm_id=track.article
-            )
-        ) as response:
-            data = await response.json()
-            price = data['data']['products'][0]['salePriceU'] / 100
-            return await price_history_crud.create(
-                PriceHistoryCreate(price=price, track_id=track_id),
-                session
-            )
+    """
+    Обновляет товар и возвращает последнюю запись его истории.
+
+    Товар обновляется тем же путем, что и при обновлении подписки:
+    новая запись появляется у всех подписчиков, если цена или название
+    изменились. Если цена не изменилась, возвращается последняя запись.
+    """
+    track = await track_crud.get_or_404(
+        track_id,
+        session,
+        owner_id=user.id,
+        options=TRACK_WITH_HISTORY_OPTIONS
+    )
+    check_marketplace_supported(
+        track.marketplace, marketplace_registry.supported_marketplaces()
+    )
+    products = await claim_products([track.product], session)
+    await refresh_task_crud.delete_by_product_ids(
+        [product.id for product in products], session
+    )
+    await refresh_tracks([track], session, products=products)
+    price_history = await price_history_crud.get_history_by_track_id(
+        track_id, session
+    )
+    if price_history:
+        return price_history[-1]
+    return await price_history_crud.create(
+        PriceHistoryCreate(price=track.current_price, track_id=track_id),
+        session
+    )
@@ -1,18 +1,24 @@
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.v1.utils import get_wildberries_product_data, wildberries_parse
+from src.api.v1.utils import claim_products, refresh_tracks
 from src.api.v1.validators import (
-    check_track_exists_by_id, check_track_with_marketplace_and_article_exists,
+    check_marketplace_supported,
+    check_track_with_marketplace_and_article_exists,
     check_unique_track_by_marketplace_article, not_negative_target_price,
     validate_marketplace)
 from src.core.user import current_user
 from src.crud.price_history import price_history_crud
-from src.crud.track import track_crud
+from src.crud.product import product_crud
+from src.crud.refresh_task import refresh_task_crud
+from src.crud.track import (TRACK_READ_OPTIONS, TRACK_WITH_HISTORY_OPTIONS,
+                            track_crud)
 from src.database.db import get_async_session
 from src.database.enums import Marketplace
+from src.marketplaces.registry import marketplace_registry
 from src.models.user import User
 from src.schemas.price_history import PriceHistoryCreate
+from src.schemas.product import ProductCreate
 from src.schemas.track import (TrackDB, TrackDBCreate, TrackFilterSchema,
                                TrackUpdate, TrackUserDataCreate)
 
@@ -41,7 +47,9 @@ async def get_users_tracks(
         user_id=user.id
     )
     """Возвращает все объекты Track."""
-    return await track_crud.get_all(filter_schema, session)
+    return await track_crud.get_all(
+        filter_schema, session, options=TRACK_READ_OPTIONS
+    )
 
 
 @router.get(
@@ -56,8 +64,9 @@ async def get_track_by_id(
     user: User = Depends(current_user)
 ) -> TrackDB:
     """Получает конкретный объект Track по его id."""
-    await check_track_exists_by_id(track_id, track_crud, session)
-    return await track_crud.get(track_id, session)
+    return await track_crud.get_or_404(
+        track_id, session, owner_id=user.id, options=TRACK_READ_OPTIONS
+    )
 
 
 @router.get(
@@ -74,7 +83,7 @@ async def get_track_by_artice_and_marketplace(
 ):
     validate_marketplace(marketplace)
     track = await track_crud.get_track_by_artice_and_marketplace(
-        article, marketplace, session
+        article, marketplace, user.id, session, options=TRACK_READ_OPTIONS
     )
     check_track_with_marketplace_and_article_exists(
         track, article, marketplace
@@ -94,32 +103,36 @@ async def create_track(
 ):
     """Создает новый объект Track."""
     not_negative_target_price(create_track_schema.target_price)
+    adapter = marketplace_registry.get(create_track_schema.marketplace)
     await check_unique_track_by_marketplace_article(
         create_track_schema.marketplace,
         create_track_schema.article,
         user.id,
         session
     )
-    track_db_create_schema = TrackDBCreate(
-        user_id=user.id, **create_track_schema.model_dump()
+    product = await product_crud.get_product_by_marketplace_and_article(
+        create_track_schema.marketplace,
+        create_track_schema.article,
+        session
     )
-    if create_track_schema.marketplace == Marketplace.WILDBERRIES.value:
-        parsed_data = await wildberries_parse(
-            track_db_create_schema.article
+    if product is None:
+        product_create_schema = adapter.get_product_data(
+            ProductCreate(
+                marketplace=create_track_schema.marketplace,
+                article=create_track_schema.article
+            ),
+            await adapter.fetch_one(create_track_schema.article)
         )
-        create_track_schema = get_wildberries_product_data(
-            track_db_create_schema, parsed_data
-        )
-    # Добавить условие, если необходимо поддержка нескольких маркетплейсов.
-    else:
-        parsed_data = await wildberries_parse(
-            track_db_create_schema.article
-        )
-        create_track_schema = get_wildberries_product_data(
-            track_db_create_schema, parsed_data
+        product = await product_crud.get_or_create(
+            product_create_schema, session
         )
     new_track = await track_crud.create(
-        track_db_create_schema, session
+        TrackDBCreate(
+            user_id=user.id,
+            product_id=product.id,
+            **create_track_schema.model_dump()
+        ),
+        session
     )
     await price_history_crud.create(
         PriceHistoryCreate(
@@ -128,7 +141,9 @@ async def create_track(
         ),
         session
     )
-    return new_track
+    return await track_crud.get(
+        new_track.id, session, options=TRACK_READ_OPTIONS
+    )
 
 
 @router.patch(
@@ -143,12 +158,14 @@ async def update_track(
     user: User = Depends(current_user)
 ) -> TrackDB:
     """Обновляет существующий объект Track по id (вручную)."""
-    await check_track_exists_by_id(track_id, track_crud, session)
-    return await track_crud.update(
-        await track_crud.get(track_id, session),
-        update_track_schema,
-        session
+    track = await track_crud.get_or_404(
+        track_id, session, owner_id=user.id, options=TRACK_READ_OPTIONS
+    )
+    await track_crud.update(
+        track, update_track_schema, session, commit_on=False
     )
+    await session.commit()
+    return track
 
 
 @router.patch(
@@ -161,15 +178,58 @@ async def refresh_data_for_existen_track(
     session: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_user)
 ):
-    """Обновляет данные о товаре (для онлайн режима)."""
-    track = await track_crud.get(track_id, session)
-    new_parsed_data = await wildberries_parse(track.article)
-    update_track_schema = get_wildberries_product_data(
-        TrackUpdate(), new_parsed_data
-    )
-    return await track_crud.update(
-        track,
-        update_track_schema,
+    """
+    Обновляет данные о товаре (для онлайн режима).
+
+    Товар обновляется сразу, независимо от времени следующей проверки,
+    тем же путем, что и массовое обновление: с записью в историю,
+    пересчетом notified, уведомлением о снижении цены и новым
+    next_check_at. Товар, который сейчас обновляет воркер, повторно
+    не запрашивается. Если маркетплейс недоступен, возвращается последняя
+    известная цена с флагом stale.
+    """
+    track = await track_crud.get_or_404(
+        track_id,
+        session,
+        owner_id=user.id,
+        options=TRACK_WITH_HISTORY_OPTIONS
+    )
+    check_marketplace_supported(
+        track.marketplace, marketplace_registry.supported_marketplaces()
+    )
+    products = await claim_products([track.product], session)
+    await refresh_task_crud.delete_by_product_ids(
+        [product.id for product in products], session
+    )
+    await refresh_tracks([track], session, products=products)
+    return track
+
+
+@router.post(
+    '/tracks/refresh',
+    response_model=list[TrackDB],
+    status_code=status.HTTP_200_OK
+)
+async def refresh_users_tracks(
+    is_active: bool = Query(None),
+    marketplace: Marketplace = Query(None),
+    session: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_user)
+) -> list[TrackDB]:
+    """
+    Обновляет данные обо всех товарах пользователя за один запрос.
+
+    Возвращает только товары, у которых изменился статус уведомления.
+    """
+    filter_schema = TrackFilterSchema(
+        marketplace=marketplace,
+        is_active=is_active,
+        user_id=user.id
+    )
+    return await refresh_tracks(
+        await track_crud.get_all(
+            filter_schema, session, options=TRACK_WITH_HISTORY_OPTIONS
+        ),
         session
     )
 
@@ -185,7 +245,7 @@ async def compare_target_and_current_price(
     user: User = Depends(current_user)
 ):
     """Сравнивает текущую и целевую цену товара."""
-    track = await track_crud.get(track_id, session)
+    track = await track_crud.get_or_404(track_id, session, owner_id=user.id)
     if track.current_price <= track.target_price:
         return dict(status=True)
     return dict(status=False)
@@ -201,7 +261,9 @@ async def delete_track(
     session: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_user)
 ) -> TrackDB:
-    await check_track_exists_by_id(track_id, track_crud, session)
     return await track_crud.delete(
-        await track_crud.get(track_id, session), session
+        await track_crud.get_or_404(
+            track_id, session, owner_id=user.id, options=TRACK_READ_OPTIONS
+        ),
+        session
     )
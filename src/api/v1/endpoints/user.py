@@ -14,10 +14,10 @@ from src.api.v1.validators import (check_unique_jwt_token_exists_by_user_id,
                                    check_user_exists_by_id,
                                    check_yourself_or_superuser)
 from src.core.user import (AUTH_BACKEND_NAME, UserManager, auth_backend,
-                           current_user, fastapi_users,
+                           current_db_user, current_user, fastapi_users,
                            get_user_db, get_user_manager)
 from src.crud.jwt_auth import jwt_token_crud
-from src.crud.user import user_crud
+from src.crud.user import USER_READ_OPTIONS, user_crud
 from src.database.db import get_async_session
 from src.models.user import User
 from src.schemas.jwt_auth import JWTTokenCreate, JWTTokenUpdate
@@ -195,7 +195,7 @@ async def delete_user(
 async def update_me(
     request: Request,
     user_update: UserUpdate,
-    user: User = Depends(current_user),
+    user: User = Depends(current_db_user),
     user_manager: BaseUserManager = Depends(get_user_manager),
     session: AsyncSession = Depends(get_async_session)
 ):
@@ -254,7 +254,7 @@ async def check_existence_user_by_telegram_id(
     session: AsyncSession = Depends(get_async_session),
 ):
     user = await user_crud.get_user_by_telegram_id(
-        telegram_id_schema.telegram_id, session
+        telegram_id_schema.telegram_id, session, options=USER_READ_OPTIONS
     )
     return user if user else None
 
@@ -269,7 +269,7 @@ async def check_existence_user_by_email(
     session: AsyncSession = Depends(get_async_session),
 ):
     user = await user_crud.get_user_by_email(
-        email_schema.email, session
+        email_schema.email, session, options=USER_READ_OPTIONS
     )
     return user if user else None
 
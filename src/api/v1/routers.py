@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
-from src.api.v1.endpoints import (media_router, price_history_router,
+from src.api.v1.endpoints import (media_router, metrics_router,
+                                  notification_router, price_history_router,
                                   track_router, user_router)
 
 TRACK_TAGS = ['track']
@@ -9,6 +10,12 @@ PRICE_HISTORY_TAGS = ['price_history']
 MEDIA_PREFIX = '/media'
 MEDIA_TAGS = ['media']
 
+NOTIFICATION_PREFIX = '/notifications'
+NOTIFICATION_TAGS = ['notifications']
+
+METRICS_PREFIX = '/metrics'
+METRICS_TAGS = ['metrics']
+
 
 main_router = APIRouter()
 
@@ -24,3 +31,9 @@ main_router.include_router(
 main_router.include_router(
     media_router, prefix=MEDIA_PREFIX, tags=MEDIA_TAGS
 )
+main_router.include_router(
+    notification_router, prefix=NOTIFICATION_PREFIX, tags=NOTIFICATION_TAGS
+)
+main_router.include_router(
+    metrics_router, prefix=METRICS_PREFIX, tags=METRICS_TAGS
+)
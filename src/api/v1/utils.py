@@ -1,50 +1,334 @@
 """Модель для вспомогательных инструментов."""
 
+import asyncio
+import heapq
+from collections import defaultdict
+from datetime import datetime
 from decimal import Decimal
-from typing import Union
+from operator import attrgetter
+from typing import Optional
 
-import aiohttp
 from fastapi import HTTPException, status
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
-from src.api.v1.constants import WILDBBERIES_PRODUCT_CARD_URL
-from src.api.v1.validators import check_not_existent_article
-from src.schemas.track import TrackDBCreate, TrackUpdate
+from src.api.v1.constants import MAX_TRACKS_PRICE_HISTORY_LEN
+from src.core.config import settings
+from src.core.polling import get_check_interval, is_check_due
+from src.crud.price_drop import price_drop_event_crud
+from src.crud.price_history import price_history_crud
+from src.crud.product import product_crud
+from src.crud.refresh_task import refresh_task_crud
+from src.crud.track import TRACK_WITH_HISTORY_OPTIONS, track_crud
+from src.database.enums import Marketplace
+from src.marketplaces.base import MarketplaceCards
+from src.marketplaces.registry import marketplace_registry
+from src.models.product import Product
+from src.models.track import Track
+from src.schemas.price_drop import PriceDropEventCreate
+from src.schemas.price_history import PriceHistoryCreate
+from src.schemas.product import ProductUpdate
 
-GET_WILDBERRIES_PRODUCT_DATA_ERROR = (
-    'Ошибка при получении данных для товара {article}. '
-    'Возможно товара нет в наличии!'
+REFRESH_TRACKS_ERROR = (
+    'Ошибка сервера при обновлении товаров! Текст ошибки: {error}'
 )
 
+PRICE_DROP_IDEMPOTENCY_KEY = (
+    'price_drop:{track_id}:{target_price}:{notified_at}'
+)
+
+
+def get_price_drop_idempotency_key(
+    track_id: int, target_price: Decimal, notified_at: datetime
+) -> str:
+    """
+    Ключ идемпотентности уведомления о снижении цены.
+
+    notified_at - время, когда UPDATE выставил подписке флаг notified.
+    Одно и то же снижение порождает не больше одного уведомления,
+    а каждое новое пересечение желаемой цены получает новый ключ,
+    даже если товар между ними не проверялся.
+    """
+    return PRICE_DROP_IDEMPOTENCY_KEY.format(
+        track_id=track_id,
+        target_price=target_price,
+        notified_at=notified_at
+    )
+
+
+def is_product_data_changed(
+    product: Product, update_product_schema: ProductUpdate
+) -> bool:
+    """Проверяет, отличаются ли цена и название от сохраненных."""
+    return (
+        product.current_price != update_product_schema.current_price
+        or product.title != update_product_schema.title
+    )
+
+
+async def fetch_products_cards(
+    products: list[Product]
+) -> dict[Marketplace, MarketplaceCards]:
+    """
+    Получает карточки товаров через адаптеры их маркетплейсов.
 
-async def wildberries_parse(article: str) -> dict:
-    """Получает информацию о товаре по его артикулу."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            WILDBBERIES_PRODUCT_CARD_URL.format(
-                nm_id=article
+    Маркетплейсы опрашиваются конкурентно, товары маркетплейсов без
+    адаптера пропускаются.
+    """
+    articles = defaultdict(list)
+    for product in products:
+        if marketplace_registry.is_supported(product.marketplace):
+            articles[product.marketplace].append(product.article)
+    fetched_cards = await asyncio.gather(*[
+        marketplace_registry.get(marketplace).fetch_many_or_stale(
+            marketplace_articles
+        )
+        for marketplace, marketplace_articles in articles.items()
+    ])
+    return dict(zip(articles, fetched_cards))
+
+
+async def refresh_products(
+    products: list[Product],
+    session: AsyncSession
+) -> tuple[set[int], set[int]]:
+    """
+    Обновляет цену и название товаров по их карточкам.
+
+    Каждый товар запрашивается и обновляется один раз, независимо от
+    числа подписчиков. У товаров без изменений одним UPDATE обновляется
+    только last_checked_at. Возвращает id товаров с изменившимися
+    ценой или названием и id товаров, которые не удалось обновить
+    из-за сбоя маркетплейса (устаревшие данные).
+    """
+    changed_product_ids = set()
+    unchanged_product_ids = list()
+    checked_at = datetime.now()
+    cards = await fetch_products_cards(products)
+    stale_articles = {
+        (marketplace, article)
+        for marketplace, marketplace_cards in cards.items()
+        for article in marketplace_cards.failed
+    }
+    stale_product_ids = {
+        product.id for product in products
+        if (product.marketplace, product.article) in stale_articles
+    }
+    for product in products:
+        marketplace_cards = cards.get(product.marketplace, dict())
+        if product.article not in marketplace_cards:
+            continue
+        try:
+            update_product_schema = marketplace_registry.get(
+                product.marketplace
+            ).get_product_data(
+                ProductUpdate(), marketplace_cards[product.article]
             )
-        ) as response:
-            data = await response.json()
-            check_not_existent_article(article, data)
-            return data
+        except HTTPException:
+            continue
+        if not is_product_data_changed(product, update_product_schema):
+            unchanged_product_ids.append(product.id)
+            continue
+        update_product_schema.last_checked_at = checked_at
+        await product_crud.update(
+            product, update_product_schema, session, commit_on=False
+        )
+        changed_product_ids.add(product.id)
+    await product_crud.update_last_checked_at(
+        unchanged_product_ids, checked_at, session
+    )
+    return changed_product_ids, stale_product_ids
+
 
+async def schedule_next_checks(
+    products: list[Product],
+    session: AsyncSession
+) -> None:
+    """
+    Назначает товарам время следующей проверки цены.
 
-def get_wildberries_product_data(
-    track_schema: Union[TrackDBCreate, TrackUpdate], product_data
-) -> Union[TrackDBCreate, TrackUpdate]:
-    """Заполняет поля объекта Track по полученном товару."""
+    Интервал зависит от частоты изменения цены в истории и близости
+    текущей цены к желаемым ценам подписчиков.
+    """
+    if not products:
+        return
+    product_ids = [product.id for product in products]
+    history = defaultdict(list)
+    for product_id, created_at, price in (
+        await price_history_crud.get_history_by_product_ids(
+            product_ids, session
+        )
+    ):
+        history[product_id].append((created_at, price))
+    target_prices = defaultdict(list)
+    for product_id, target_price in (
+        await track_crud.get_target_prices_by_product_ids(
+            product_ids, session
+        )
+    ):
+        target_prices[product_id].append(target_price)
+    now = datetime.now()
+    for product in products:
+        await product_crud.update(
+            product,
+            ProductUpdate(
+                next_check_at=now + get_check_interval(
+                    history[product.id],
+                    product.current_price,
+                    target_prices[product.id],
+                    now
+                )
+            ),
+            session,
+            commit_on=False
+        )
+
+
+def get_due_products(tracks: list[Track]) -> list[Product]:
+    """
+    Возвращает товары, цену которых пора проверить.
+
+    Товары упорядочены по времени следующей проверки, их число
+    ограничено настройкой polling_max_products_per_refresh.
+    """
+    now = datetime.now()
+    products = {track.product_id: track.product for track in tracks}
+    return heapq.nsmallest(
+        settings.polling_max_products_per_refresh,
+        [
+            product for product in products.values()
+            if is_check_due(product.next_check_at, now)
+        ],
+        key=lambda product: product.next_check_at or datetime.min
+    )
+
+
+async def claim_products(
+    products: list[Product],
+    session: AsyncSession
+) -> list[Product]:
+    """
+    Забирает товары на обновление через очередь refreshtask.
+
+    Так же, как воркер обновления, запрос получает задачи товаров
+    (FOR UPDATE SKIP LOCKED) и сразу фиксирует их, поэтому товар,
+    который сейчас обновляет воркер, пропускается, а воркер не
+    возьмет товары, забранные запросом. Задачи удаляются в транзакции
+    обновления (refresh_tracks).
+    """
+    claimed_product_ids = set(await refresh_task_crud.claim_products(
+        [product.id for product in products],
+        settings.refresh_worker_visibility_timeout,
+        session
+    ))
+    await session.commit()
+    return [
+        product for product in products
+        if product.id in claimed_product_ids
+    ]
+
+
+async def refresh_tracks(
+    tracks: list[Track],
+    session: AsyncSession,
+    products: Optional[list[Product]] = None
+) -> list[Track]:
+    """
+    Обновляет данные о товарах в одной транзакции.
+
+    Сначала обновляются товары (Product) из products, уже забранные
+    из очереди refreshtask. По умолчанию через очередь забираются
+    товары подписок, для которых подошло время проверки, а их задачи
+    удаляются вместе с обновлением. Затем флаг
+    notified пересчитывается одним UPDATE, а для товаров с изменившейся ценой или названием
+    добавляется запись в историю. Это делается для всех активных
+    подписок на изменившиеся товары, а не только для переданных
+    tracks: одно обновление цены доходит до каждого подписчика.
+    Для подписок, цена которых опустилась до желаемой, в той же
+    транзакции создается уведомление PriceDropEvent (outbox).
+    Товары, которые не удалось обновить из-за сбоя маркетплейса,
+    сохраняют последнюю известную цену и время проверки, а их
+    подписки помечаются флагом stale.
+    Возвращает подписки из tracks, у которых изменился статус
+    уведомления.
+    """
+    if products is None:
+        products = await claim_products(get_due_products(tracks), session)
+        await refresh_task_crud.delete_by_product_ids(
+            [product.id for product in products], session
+        )
+    due_products = products
+    changed_product_ids, stale_product_ids = await refresh_products(
+        due_products, session
+    )
+    subscriber_tracks = {track.id: track for track in tracks}
+    caller_track_ids = set(subscriber_tracks)
+    if changed_product_ids:
+        for track in await track_crud.get_active_tracks_by_product_ids(
+            list(changed_product_ids),
+            session,
+            options=TRACK_WITH_HISTORY_OPTIONS
+        ):
+            subscriber_tracks.setdefault(track.id, track)
+    changed_rows = {
+        row.id: row for row in await track_crud.update_notified(
+            list(subscriber_tracks), session
+        )
+    }
+    changed_tracks = []
+    price_drop_events = []
+    for track in subscriber_tracks.values():
+        track.stale = track.product_id in stale_product_ids
+        if track.id in changed_rows:
+            row = changed_rows[track.id]
+            set_committed_value(track, 'notified', row.notified)
+            if track.id in caller_track_ids:
+                changed_tracks.append(track)
+            if row.notified:
+                price_drop_events.append(
+                    PriceDropEventCreate(
+                        track_id=row.id,
+                        user_id=row.user_id,
+                        article=row.article,
+                        price=track.current_price,
+                        idempotency_key=get_price_drop_idempotency_key(
+                            row.id, row.target_price, row.updated_at
+                        )
+                    )
+                )
+        if track.product_id not in changed_product_ids:
+            continue
+        if len(track.price_history) >= MAX_TRACKS_PRICE_HISTORY_LEN:
+            await price_history_crud.delete(
+                min(track.price_history, key=attrgetter('created_at')),
+                session,
+                commit_on=False
+            )
+        await price_history_crud.create(
+            PriceHistoryCreate(
+                price=track.current_price,
+                track_id=track.id
+            ),
+            session,
+            commit_on=False
+        )
+    await price_drop_event_crud.create_many_if_not_exists(
+        price_drop_events, session
+    )
+    await schedule_next_checks(
+        [
+            product for product in due_products
+            if product.id not in stale_product_ids
+        ],
+        session
+    )
     try:
-        track_schema.current_price = Decimal(str(
-            int(
-                    product_data['data']['products'][0].get('salePriceU')
-                ) / 100
-        ))
-        track_schema.title = product_data['data']['products'][0]['name']
-        return track_schema
-    except Exception:
+        await session.commit()
+    except SQLAlchemyError as error:
+        await session.rollback()
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=GET_WILDBERRIES_PRODUCT_DATA_ERROR.format(
-                article=track_schema.article
-            )
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=REFRESH_TRACKS_ERROR.format(error=str(error))
         )
+    return changed_tracks
@@ -10,7 +10,6 @@ from src.database.enums import Marketplace
 from src.models.track import Track
 from src.models.user import User
 
-TRACK_NOT_EXISTS_BY_ID_ERROR = 'Товара с id = {id} не существует!'
 USER_NOT_EXISTS_BY_ID_ERROR = 'Пользователя с id = {id} не существует!'
 NOT_UNIQUE_TRACK_BY_MARKETPLACE_AND_ARTICLE = (
     'Товар с маркетплэйсом {marketplace} и артикулом {article} '
@@ -37,21 +36,6 @@ TRACK_WITH_ARTICLE_AND_MARKETPLACE_NOT_EXISTS_ERROR = (
 )
 
 
-async def check_object_exists_by_id(
-    object_id: int,
-    object_crud,
-    error_message: str,
-    session: AsyncSession
-) -> None:
-    """Базовая функция для проверки существования объекта по id."""
-    db_object = await object_crud.get(object_id, session)
-    if not db_object:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=error_message.format(id=object_id)
-        )
-
-
 def not_negative_target_price(target_price: Decimal) -> None:
     """Проверяет желаемую цену."""
     if target_price < Decimal('0'):
@@ -63,20 +47,6 @@ def not_negative_target_price(target_price: Decimal) -> None:
         )
 
 
-async def check_track_exists_by_id(
-    track_id: int,
-    track_crud,
-    session: AsyncSession
-) -> None:
-    """Проверяет существование объекта Track по его id."""
-    await check_object_exists_by_id(
-        track_id,
-        track_crud,
-        TRACK_NOT_EXISTS_BY_ID_ERROR,
-        session
-    )
-
-
 async def check_user_exists_by_id(
     user_id: int,
     user_db: SQLAlchemyUserDatabase
@@ -130,9 +100,9 @@ async def check_unique_track_by_marketplace_article(
         )
 
 
-def check_not_existent_article(article: str, data: dict) -> None:
-    """Проверяет существование артикула товара."""
-    if not data['data']['products']:
+def check_not_existent_article(article: str, cards: dict) -> None:
+    """Проверяет существование артикула товара среди карточек."""
+    if article not in cards:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=NOT_EXISTENT_ARTICLE_ERROR.format(
@@ -170,6 +140,24 @@ def validate_marketplace(
         )
 
 
+def check_marketplace_supported(
+    marketplace: Marketplace,
+    supported_marketplaces: list[Marketplace]
+) -> None:
+    """Проверяет, что товары маркетплейса можно обновлять."""
+    if marketplace not in supported_marketplaces:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=VALIDATE_MARKET_PLACE_ERROR.format(
+                marketplace=marketplace,
+                valid_marketplaces=[
+                    marketplace.value
+                    for marketplace in supported_marketplaces
+                ]
+            )
+        )
+
+
 def check_track_with_marketplace_and_article_exists(
     track: Track,
     article: str,
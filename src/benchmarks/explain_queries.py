@@ -0,0 +1,149 @@
+"""
+Проверка планов горячих запросов к подпискам и истории цен.
+
+Выполняет EXPLAIN для запросов, повторяющих запросы TrackCRUD
+и PriceHistoryCRUD, и проверяет, что в плане нет Seq Scan. На
+маленькой таблице планировщик выбирает Seq Scan даже при наличии
+индекса, поэтому по умолчанию он отключается (enable_seqscan = off)
+и проверяется только то, что подходящий индекс существует. С флагом
+--natural планы строятся без этой настройки, как на рабочей базе.
+Запуск после alembic upgrade head:
+
+    python -m src.benchmarks.explain_queries [--natural]
+"""
+
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import asc, select, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from src.crud.track import track_crud
+from src.database.db import engine
+from src.database.enums import Marketplace
+from src.models.price_history import PriceHistory
+from src.models.track import Track
+
+SAMPLE_ID = 1
+SAMPLE_IDS = [1, 2, 3]
+SAMPLE_ARTICLE = '123456789'
+
+DISABLE_SEQSCAN = 'SET LOCAL enable_seqscan = off'
+SEQ_SCAN_NODE = 'Seq Scan'
+
+PARSER_DESCRIPTION = 'Проверка планов горячих запросов.'
+QUERY_OK_MESSAGE = 'OK   {name}: {indexes}'
+QUERY_FAILED_MESSAGE = 'FAIL {name}: Seq Scan по {relations}'
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) для произвольного запроса."""
+
+    inherit_cache = False
+
+    def __init__(self, statement) -> None:
+        self.statement = statement
+
+
+@compiles(Explain, 'postgresql')
+def compile_explain(element: Explain, compiler, **kwargs) -> str:
+    return 'EXPLAIN (FORMAT JSON) ' + compiler.process(
+        element.statement, **kwargs
+    )
+
+
+HOT_QUERIES = {
+    'TrackCRUD.get_or_404': track_crud.get_query().where(
+        Track.id == SAMPLE_ID,
+        Track.user_id == SAMPLE_ID
+    ),
+    'TrackCRUD.get_all': track_crud.get_query().where(
+        Track.user_id == SAMPLE_ID,
+        Track.marketplace == Marketplace.WILDBERRIES
+    ),
+    'TrackCRUD.get_track_by_artice_and_marketplace': (
+        track_crud.get_query().where(
+            Track.article == SAMPLE_ARTICLE,
+            Track.marketplace == Marketplace.WILDBERRIES,
+            Track.user_id == SAMPLE_ID
+        )
+    ),
+    'TrackCRUD.get_active_tracks_by_product_ids': (
+        track_crud.get_query().where(
+            Track.product_id.in_(SAMPLE_IDS),
+            Track.is_active.is_(True)
+        )
+    ),
+    'PriceHistoryCRUD.get_history_by_track_id': select(PriceHistory).where(
+        PriceHistory.track_id == SAMPLE_ID
+    ).order_by(PriceHistory.created_at),
+    'PriceHistoryCRUD.get_history_by_product_ids': select(
+        Track.product_id, PriceHistory.created_at, PriceHistory.price
+    ).join(
+        Track, Track.id == PriceHistory.track_id
+    ).where(Track.product_id.in_(SAMPLE_IDS)),
+    'PriceHistoryCRUD.delete_the_oldest_price_history': select(
+        PriceHistory
+    ).where(
+        PriceHistory.track_id == SAMPLE_ID
+    ).order_by(asc(PriceHistory.created_at)).limit(1),
+}
+
+
+def get_plan_nodes(plan: dict):
+    """Обходит все узлы плана."""
+    yield plan
+    for child in plan.get('Plans', ()):
+        yield from get_plan_nodes(child)
+
+
+async def check_queries(natural: bool) -> bool:
+    """Печатает результат проверки каждого запроса."""
+    all_passed = True
+    async with engine.connect() as connection:
+        for name, statement in HOT_QUERIES.items():
+            async with connection.begin() as transaction:
+                if not natural:
+                    await connection.execute(text(DISABLE_SEQSCAN))
+                explain = (
+                    await connection.execute(Explain(statement))
+                ).scalar()
+                await transaction.rollback()
+            nodes = list(get_plan_nodes(explain[0]['Plan']))
+            seq_scans = sorted({
+                node['Relation Name'] for node in nodes
+                if node['Node Type'] == SEQ_SCAN_NODE
+            })
+            if seq_scans:
+                all_passed = False
+                print(QUERY_FAILED_MESSAGE.format(
+                    name=name, relations=', '.join(seq_scans)
+                ))
+                continue
+            print(QUERY_OK_MESSAGE.format(
+                name=name,
+                indexes=', '.join(sorted({
+                    node['Index Name'] for node in nodes
+                    if 'Index Name' in node
+                }))
+            ))
+    await engine.dispose()
+    return all_passed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=PARSER_DESCRIPTION)
+    parser.add_argument(
+        '--natural',
+        action='store_true',
+        help='Не отключать Seq Scan (проверка на рабочих данных).'
+    )
+    arguments = parser.parse_args()
+    if not asyncio.run(check_queries(arguments.natural)):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
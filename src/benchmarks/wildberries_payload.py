@@ -0,0 +1,101 @@
+"""
+Микробенчмарк разбора ответа card.wb.ru.
+
+Сравнивает прежний путь (json.loads всего ответа и словари карточек)
+с декодером decode_wildberries_cards. Запуск:
+
+    python -m src.benchmarks.wildberries_payload
+"""
+
+import json
+import sys
+import timeit
+
+from src.core.config import settings
+from src.marketplaces.decoders import decode_wildberries_cards
+
+DEFAULT_REPEAT = 5
+DEFAULT_NUMBER = 200
+
+
+def build_payload(cards_count: int) -> bytes:
+    """Ответ с карточками, по структуре близкими к ответу card.wb.ru."""
+    products = [
+        dict(
+            id=100000 + index,
+            root=200000 + index,
+            kindId=0,
+            subjectId=105,
+            subjectParentId=784,
+            name=f'Товар {index}',
+            brand='Бренд',
+            brandId=31000 + index,
+            siteBrandId=0,
+            supplierId=500000 + index,
+            sale=30,
+            priceU=150000 + index * 100,
+            salePriceU=105000 + index * 70,
+            logisticsCost=0,
+            saleConditions=0,
+            pics=12,
+            rating=5,
+            reviewRating=4.8,
+            feedbacks=1000 + index,
+            volume=12,
+            colors=[dict(name='черный', id=0)],
+            sizes=[
+                dict(
+                    name=size,
+                    origName=size,
+                    rank=0,
+                    optionId=300000 + index * 10 + number,
+                    stocks=[
+                        dict(wh=507, dtype=4, qty=10, time1=2, time2=30),
+                        dict(wh=117986, dtype=4, qty=3, time1=3, time2=40),
+                    ],
+                    time1=2,
+                    time2=30,
+                    wh=507,
+                    sign='x' * 44,
+                )
+                for number, size in enumerate(('S', 'M', 'L', 'XL'))
+            ],
+            diffPrice=False,
+        )
+        for index in range(cards_count)
+    ]
+    return json.dumps(
+        dict(state=0, data=dict(products=products)), ensure_ascii=False
+    ).encode()
+
+
+def decode_with_json(payload: bytes) -> dict[str, dict]:
+    """Прежний путь: полный разбор ответа и словари карточек."""
+    data = json.loads(payload)
+    return {str(card['id']): card for card in data['data']['products']}
+
+
+def main() -> None:
+    cards_count = (
+        int(sys.argv[1]) if len(sys.argv) > 1
+        else settings.wildberries_batch_size
+    )
+    payload = build_payload(cards_count)
+    print(
+        f'Карточек в ответе: {cards_count}, '
+        f'размер ответа: {len(payload) / 1024:.1f} КБ'
+    )
+    for title, decode in (
+        ('json.loads', decode_with_json),
+        ('decode_wildberries_cards', decode_wildberries_cards),
+    ):
+        best = min(timeit.repeat(
+            lambda: decode(payload),
+            repeat=DEFAULT_REPEAT,
+            number=DEFAULT_NUMBER
+        )) / DEFAULT_NUMBER
+        print(f'{title}: {best * 1_000_000:.0f} мкс на ответ')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+"""Модуль с in-process кэшем с ограничением по времени жизни записей."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Iterable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Кэш с временем жизни записей (TTL) и ограничением размера (LRU).
+
+    Одновременные промахи по одному ключу объединяются (single-flight):
+    загрузка выполняется один раз, остальные корутины ждут ее результата.
+    Счетчики hits, misses и coalesced позволяют подобрать TTL.
+    """
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = (
+            OrderedDict()
+        )
+        self._in_flight: dict[Hashable, asyncio.Future] = dict()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Возвращает актуальное значение по ключу."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Сохраняет значение, вытесняя самые старые записи."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Удаляет запись из кэша."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Очищает кэш."""
+        self._entries.clear()
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Возвращает значение из кэша или загружает его через loader."""
+        async def load_many(keys: list[Hashable]) -> dict[Hashable, Any]:
+            return {key: await loader()}
+
+        return (await self.get_many_or_load([key], load_many)).get(key)
+
+    async def get_many_or_load(
+        self,
+        keys: Iterable[Hashable],
+        loader: Callable[[list[Hashable]], Awaitable[dict[Hashable, Any]]]
+    ) -> dict[Hashable, Any]:
+        """
+        Возвращает значения по ключам, загружая отсутствующие одним вызовом.
+
+        loader получает список ключей-промахов и возвращает словарь
+        найденных значений. Значения None не кэшируются и в результат
+        не попадают.
+        """
+        result = dict()
+        waiting = dict()
+        keys_to_load = list()
+        for key in dict.fromkeys(keys):
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                self.hits += 1
+                result[key] = value
+            elif key in self._in_flight:
+                self.coalesced += 1
+                waiting[key] = self._in_flight[key]
+            else:
+                self.misses += 1
+                keys_to_load.append(key)
+        if keys_to_load:
+            result.update(await self._load(keys_to_load, loader))
+        retry_keys = list()
+        for key, future in waiting.items():
+            try:
+                value = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                retry_keys.append(key)
+                continue
+            if value is not None:
+                result[key] = value
+        if retry_keys:
+            result.update(await self.get_many_or_load(retry_keys, loader))
+        return result
+
+    async def _load(
+        self,
+        keys: list[Hashable],
+        loader: Callable[[list[Hashable]], Awaitable[dict[Hashable, Any]]]
+    ) -> dict[Hashable, Any]:
+        """Загружает значения и передает результат ожидающим корутинам."""
+        loop = asyncio.get_running_loop()
+        futures = {key: loop.create_future() for key in keys}
+        self._in_flight.update(futures)
+        try:
+            loaded = await loader(keys)
+        except asyncio.CancelledError:
+            for future in futures.values():
+                future.cancel()
+            raise
+        except Exception as error:
+            for future in futures.values():
+                future.set_exception(error)
+                # Ошибку получает вызывающий код, ожидающих может не быть.
+                future.exception()
+            raise
+        finally:
+            for key in keys:
+                self._in_flight.pop(key, None)
+        result = dict()
+        for key, future in futures.items():
+            value = loaded.get(key)
+            if value is not None:
+                self.set(key, value)
+                result[key] = value
+            future.set_result(value)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        """Возвращает счетчики использования кэша."""
+        requests = self.hits + self.misses + self.coalesced
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            coalesced=self.coalesced,
+            hit_ratio=(
+                (self.hits + self.coalesced) / requests if requests else 0.0
+            ),
+            size=len(self._entries),
+            maxsize=self.maxsize,
+            ttl=self.ttl
+        )
@@ -0,0 +1,80 @@
+"""Модуль с автоматическим выключателем (circuit breaker) для маркетплейсов."""
+
+import time
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """
+    Автоматический выключатель запросов к одному хосту.
+
+    После failure_threshold ошибок подряд выключатель размыкается и
+    запросы отклоняются без обращения к хосту. Через recovery_timeout
+    секунд пропускается один пробный запрос (half-open): успех
+    замыкает выключатель, ошибка снова размыкает его.
+    """
+
+    def __init__(
+        self, failure_threshold: int, recovery_timeout: float
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow_request(self) -> bool:
+        """Проверяет, можно ли выполнить запрос."""
+        if self.state == CLOSED:
+            return True
+        if (
+            self.state == OPEN
+            and time.monotonic() - self.opened_at >= self.recovery_timeout
+        ):
+            self.state = HALF_OPEN
+            self._probe_in_flight = False
+        if self.state == HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Учитывает успешный запрос."""
+        self.state = CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Учитывает ошибку хоста."""
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def release(self) -> None:
+        """Освобождает пробный запрос, завершившийся без результата."""
+        self._probe_in_flight = False
+
+
+class CircuitBreakerRegistry:
+    """Выключатели с общими настройками, по одному на хост."""
+
+    def __init__(
+        self, failure_threshold: int, recovery_timeout: float
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers: dict[str, CircuitBreaker] = dict()
+
+    def get(self, key: str) -> CircuitBreaker:
+        """Возвращает выключатель для ключа, создавая его при необходимости."""
+        if key not in self._breakers:
+            self._breakers[key] = CircuitBreaker(
+                self.failure_threshold, self.recovery_timeout
+            )
+        return self._breakers[key]
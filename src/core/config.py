@@ -5,6 +5,48 @@ from pydantic_settings import BaseSettings
 
 DEFAULT_APP_TITLE = 'Price Watcher'
 DEFAULT_APP_DESCRIPTION = 'Сервис для просмотра цен.'
+DEFAULT_WILDBERRIES_PRODUCT_CARD_URL = (
+    'https://card.wb.ru/cards/v1/detail'
+    '?appType=1&curr=rub&dest={dest}&spp=30&nm={nm_id}'
+)
+DEFAULT_WILDBERRIES_BATCH_SIZE = 50
+DEFAULT_WILDBERRIES_DEST = -1257786
+DEFAULT_WILDBERRIES_BATCHES_CONCURRENCY = 4
+DEFAULT_WILDBERRIES_BATCH_TIMEOUT = 10.0
+DEFAULT_CARD_CACHE_TTL = 60.0
+DEFAULT_CARD_CACHE_MAXSIZE = 10000
+DEFAULT_MARKETPLACE_CONNECTIONS_LIMIT = 100
+DEFAULT_MARKETPLACE_CONNECTIONS_LIMIT_PER_HOST = 20
+DEFAULT_MARKETPLACE_DNS_CACHE_TTL = 300
+DEFAULT_MARKETPLACE_KEEPALIVE_TIMEOUT = 30.0
+DEFAULT_MARKETPLACE_CONNECT_TIMEOUT = 3.0
+DEFAULT_MARKETPLACE_READ_TIMEOUT = 10.0
+DEFAULT_MARKETPLACE_TOTAL_TIMEOUT = 15.0
+DEFAULT_MARKETPLACE_RATE_LIMIT = 10.0
+DEFAULT_MARKETPLACE_RATE_LIMIT_BURST = 20.0
+DEFAULT_MARKETPLACE_RATE_LIMIT_MAX_WAIT = 5.0
+DEFAULT_MARKETPLACE_RATE_LIMIT_BACKEND = 'local'
+DEFAULT_MARKETPLACE_RETRY_ATTEMPTS = 3
+DEFAULT_MARKETPLACE_RETRY_BASE_DELAY = 0.2
+DEFAULT_MARKETPLACE_RETRY_MAX_DELAY = 2.0
+DEFAULT_MARKETPLACE_BREAKER_FAILURE_THRESHOLD = 5
+DEFAULT_MARKETPLACE_BREAKER_RECOVERY_TIMEOUT = 30.0
+DEFAULT_DATABASE_POOL_SIZE = 5
+DEFAULT_DATABASE_MAX_OVERFLOW = 10
+DEFAULT_DATABASE_POOL_TIMEOUT = 30.0
+DEFAULT_DATABASE_POOL_RECYCLE = 1800
+DEFAULT_DATABASE_POOL_PRE_PING = True
+DEFAULT_DATABASE_PGBOUNCER = False
+DEFAULT_AUTH_USER_MODE = 'claims'
+DEFAULT_PRINCIPAL_CACHE_TTL = 30.0
+DEFAULT_PRINCIPAL_CACHE_MAXSIZE = 10000
+DEFAULT_POLLING_MIN_INTERVAL = 60
+DEFAULT_POLLING_MAX_INTERVAL = 6 * 60 * 60
+DEFAULT_POLLING_NEAR_TARGET_DISTANCE = 0.05
+DEFAULT_POLLING_MAX_PRODUCTS_PER_REFRESH = 200
+DEFAULT_REFRESH_WORKER_BATCH_SIZE = 50
+DEFAULT_REFRESH_WORKER_VISIBILITY_TIMEOUT = 300.0
+DEFAULT_REFRESH_WORKER_POLL_INTERVAL = 5.0
 
 
 load_dotenv()
@@ -26,6 +68,71 @@ class Settings(BaseSettings):
     postgres_db: str
     postgres_port: str
     postgres_host: str
+    database_pool_size: int = DEFAULT_DATABASE_POOL_SIZE
+    database_max_overflow: int = DEFAULT_DATABASE_MAX_OVERFLOW
+    database_pool_timeout: float = DEFAULT_DATABASE_POOL_TIMEOUT
+    database_pool_recycle: int = DEFAULT_DATABASE_POOL_RECYCLE
+    database_pool_pre_ping: bool = DEFAULT_DATABASE_POOL_PRE_PING
+    database_pgbouncer: bool = DEFAULT_DATABASE_PGBOUNCER
+    wildberries_product_card_url: str = DEFAULT_WILDBERRIES_PRODUCT_CARD_URL
+    wildberries_batch_size: int = DEFAULT_WILDBERRIES_BATCH_SIZE
+    wildberries_dest: int = DEFAULT_WILDBERRIES_DEST
+    wildberries_batches_concurrency: int = (
+        DEFAULT_WILDBERRIES_BATCHES_CONCURRENCY
+    )
+    wildberries_batch_timeout: float = DEFAULT_WILDBERRIES_BATCH_TIMEOUT
+    card_cache_ttl: float = DEFAULT_CARD_CACHE_TTL
+    card_cache_maxsize: int = DEFAULT_CARD_CACHE_MAXSIZE
+    marketplace_connections_limit: int = DEFAULT_MARKETPLACE_CONNECTIONS_LIMIT
+    marketplace_connections_limit_per_host: int = (
+        DEFAULT_MARKETPLACE_CONNECTIONS_LIMIT_PER_HOST
+    )
+    marketplace_dns_cache_ttl: int = DEFAULT_MARKETPLACE_DNS_CACHE_TTL
+    marketplace_keepalive_timeout: float = (
+        DEFAULT_MARKETPLACE_KEEPALIVE_TIMEOUT
+    )
+    marketplace_connect_timeout: float = DEFAULT_MARKETPLACE_CONNECT_TIMEOUT
+    marketplace_read_timeout: float = DEFAULT_MARKETPLACE_READ_TIMEOUT
+    marketplace_total_timeout: float = DEFAULT_MARKETPLACE_TOTAL_TIMEOUT
+    marketplace_rate_limit: float = DEFAULT_MARKETPLACE_RATE_LIMIT
+    marketplace_rate_limit_burst: float = (
+        DEFAULT_MARKETPLACE_RATE_LIMIT_BURST
+    )
+    marketplace_rate_limit_max_wait: float = (
+        DEFAULT_MARKETPLACE_RATE_LIMIT_MAX_WAIT
+    )
+    marketplace_rate_limit_backend: str = (
+        DEFAULT_MARKETPLACE_RATE_LIMIT_BACKEND
+    )
+    marketplace_retry_attempts: int = DEFAULT_MARKETPLACE_RETRY_ATTEMPTS
+    marketplace_retry_base_delay: float = (
+        DEFAULT_MARKETPLACE_RETRY_BASE_DELAY
+    )
+    marketplace_retry_max_delay: float = DEFAULT_MARKETPLACE_RETRY_MAX_DELAY
+    marketplace_breaker_failure_threshold: int = (
+        DEFAULT_MARKETPLACE_BREAKER_FAILURE_THRESHOLD
+    )
+    marketplace_breaker_recovery_timeout: float = (
+        DEFAULT_MARKETPLACE_BREAKER_RECOVERY_TIMEOUT
+    )
+    auth_user_mode: str = DEFAULT_AUTH_USER_MODE
+    principal_cache_ttl: float = DEFAULT_PRINCIPAL_CACHE_TTL
+    principal_cache_maxsize: int = DEFAULT_PRINCIPAL_CACHE_MAXSIZE
+    polling_min_interval: int = DEFAULT_POLLING_MIN_INTERVAL
+    polling_max_interval: int = DEFAULT_POLLING_MAX_INTERVAL
+    polling_near_target_distance: float = (
+        DEFAULT_POLLING_NEAR_TARGET_DISTANCE
+    )
+    polling_max_products_per_refresh: int = (
+        DEFAULT_POLLING_MAX_PRODUCTS_PER_REFRESH
+    )
+    refresh_worker_batch_size: int = DEFAULT_REFRESH_WORKER_BATCH_SIZE
+    refresh_worker_visibility_timeout: float = (
+        DEFAULT_REFRESH_WORKER_VISIBILITY_TIMEOUT
+    )
+    refresh_worker_poll_interval: float = (
+        DEFAULT_REFRESH_WORKER_POLL_INTERVAL
+    )
 
 
     @property
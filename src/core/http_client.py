@@ -0,0 +1,58 @@
+"""Файл с настройками HTTP-клиента для запросов к маркетплейсам."""
+
+from typing import Optional
+
+import aiohttp
+
+from src.core.config import settings
+
+
+class MarketplaceHTTPClient:
+    """
+    Общая на процесс сессия aiohttp для запросов к маркетплейсам.
+
+    Соединения переиспользуются (keep-alive), DNS-ответы кэшируются,
+    а число соединений к одному хосту ограничено.
+    """
+
+    def __init__(self) -> None:
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @staticmethod
+    def _create_session() -> aiohttp.ClientSession:
+        """Создает сессию с пулом соединений и таймаутами из настроек."""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=settings.marketplace_connections_limit,
+                limit_per_host=(
+                    settings.marketplace_connections_limit_per_host
+                ),
+                ttl_dns_cache=settings.marketplace_dns_cache_ttl,
+                keepalive_timeout=settings.marketplace_keepalive_timeout
+            ),
+            timeout=aiohttp.ClientTimeout(
+                total=settings.marketplace_total_timeout,
+                connect=settings.marketplace_connect_timeout,
+                sock_read=settings.marketplace_read_timeout
+            )
+        )
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Возвращает общую сессию, создавая ее при необходимости."""
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+    async def start(self) -> None:
+        """Открывает общую сессию."""
+        self.session
+
+    async def close(self) -> None:
+        """Закрывает общую сессию и все ее соединения."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+marketplace_client = MarketplaceHTTPClient()
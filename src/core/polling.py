@@ -0,0 +1,90 @@
+"""Модуль с расчетом интервала проверки цены товара."""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Iterable, Optional
+
+from src.core.config import settings
+
+# Цена проверяется в среднем дважды между ее изменениями.
+CHECKS_PER_PRICE_CHANGE = 2
+
+
+def to_aware(moment: datetime) -> datetime:
+    """Приводит наивное локальное время к времени с часовым поясом."""
+    return moment if moment.tzinfo else moment.astimezone()
+
+
+def get_price_changes_interval(
+    history: list[tuple[datetime, Decimal]],
+    checked_at: datetime
+) -> Optional[float]:
+    """
+    Оценивает средний интервал между изменениями цены (в секундах).
+
+    История пишется только при изменении цены, поэтому наблюдаемый
+    период длится от первой записи до последней проверки checked_at:
+    время после последней записи цена не менялась. Если цена не
+    менялась весь период, возвращает его длину, а без истории - None.
+    """
+    if not history:
+        return None
+    history = sorted(
+        (to_aware(created_at), price) for created_at, price in history
+    )
+    changes = sum(
+        previous_price != price
+        for (_, previous_price), (_, price) in zip(history, history[1:])
+    )
+    observed_seconds = (
+        max(history[-1][0], to_aware(checked_at)) - history[0][0]
+    ).total_seconds()
+    if not changes:
+        return observed_seconds or None
+    return observed_seconds / changes / CHECKS_PER_PRICE_CHANGE
+
+
+def get_target_distance(
+    current_price: Decimal, target_prices: Iterable[Decimal]
+) -> Optional[float]:
+    """Относительное расстояние от текущей цены до ближайшей желаемой."""
+    target_prices = list(target_prices)
+    if not target_prices or not current_price:
+        return None
+    return float(min(
+        abs(current_price - target_price) for target_price in target_prices
+    ) / current_price)
+
+
+def get_check_interval(
+    history: list[tuple[datetime, Decimal]],
+    current_price: Decimal,
+    target_prices: Iterable[Decimal],
+    checked_at: datetime
+) -> timedelta:
+    """
+    Рассчитывает интервал до следующей проверки цены товара.
+
+    Интервал определяется частотой изменения цены в истории и
+    сокращается, если цена близка к желаемой цене одного из подписчиков.
+    Результат ограничен настройками polling_min_interval
+    и polling_max_interval.
+    """
+    interval = get_price_changes_interval(history, checked_at)
+    if interval is None:
+        interval = settings.polling_min_interval
+    distance = get_target_distance(current_price, target_prices)
+    if (
+        distance is not None
+        and distance < settings.polling_near_target_distance
+    ):
+        interval *= distance / settings.polling_near_target_distance
+    return timedelta(seconds=min(
+        max(interval, settings.polling_min_interval),
+        settings.polling_max_interval
+    ))
+
+
+def is_check_due(next_check_at: Optional[datetime], now: datetime) -> bool:
+    """Проверяет, пора ли обновлять цену товара."""
+    return next_check_at is None or next_check_at <= now
@@ -0,0 +1,69 @@
+"""Модуль с облегченным представлением пользователя для авторизации."""
+
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.crud.user import user_crud
+
+principal_cache = TTLCache(
+    ttl=settings.principal_cache_ttl,
+    maxsize=settings.principal_cache_maxsize
+)
+
+
+class UserPrincipal:
+    """
+    Данные пользователя, достаточные для авторизации запроса.
+
+    Не привязан к сессии БД и не имеет связей, поэтому хранится
+    в кэше между запросами. Поля совпадают с одноименными полями User.
+    """
+
+    __slots__ = (
+        'id', 'email', 'is_active', 'is_superuser', 'is_verified',
+        'telegram_id'
+    )
+
+    def __init__(
+        self,
+        id: int,
+        email: str,
+        is_active: bool,
+        is_superuser: bool,
+        is_verified: bool,
+        telegram_id: Optional[int]
+    ) -> None:
+        self.id = id
+        self.email = email
+        self.is_active = is_active
+        self.is_superuser = is_superuser
+        self.is_verified = is_verified
+        self.telegram_id = telegram_id
+
+    def __repr__(self) -> str:
+        return f'UserPrincipal(id={self.id!r}, email={self.email!r})'
+
+
+async def get_user_principal(
+    user_id: int,
+    session: AsyncSession
+) -> Optional[UserPrincipal]:
+    """
+    Возвращает данные пользователя из кэша или из БД.
+
+    Промах загружает только поля UserPrincipal одним запросом.
+    Отсутствующий пользователь не кэшируется.
+    """
+    async def load_principal() -> Optional[UserPrincipal]:
+        row = await user_crud.get_principal_data(user_id, session)
+        return UserPrincipal(**row._mapping) if row else None
+
+    return await principal_cache.get_or_load(user_id, load_principal)
+
+
+def invalidate_user_principal(user_id: int) -> None:
+    """Удаляет данные пользователя из кэша после их изменения."""
+    principal_cache.invalidate(user_id)
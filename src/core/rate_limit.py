@@ -0,0 +1,174 @@
+"""Модуль с ограничителем частоты запросов к маркетплейсам."""
+
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, update
+from sqlalchemy.dialects.postgresql import insert
+
+from src.core.config import settings
+from src.database.db import AsyncSessionLocal
+from src.models.rate_limit import RateLimitBucket
+
+RATE_LIMIT_EXCEEDED_ERROR = (
+    'Превышен лимит запросов к {key}. Повторите попытку позже.'
+)
+
+LOCAL_BACKEND = 'local'
+POSTGRES_BACKEND = 'postgres'
+
+
+class LocalTokenBucket:
+    """
+    Token bucket в памяти процесса.
+
+    Токен резервируется сразу, поэтому их число может стать
+    отрицательным: это очередь ожидающих, и время ожидания каждой
+    корутины вычисляется без блокировок.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.refilled_at = time.monotonic()
+
+    async def reserve(self) -> float:
+        """Забирает токен и возвращает время ожидания до его появления."""
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self.refilled_at) * self.rate
+        )
+        self.refilled_at = now
+        self.tokens -= 1
+        return max(0.0, -self.tokens / self.rate)
+
+    async def release(self) -> None:
+        """Возвращает неиспользованный токен, не превышая capacity."""
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+
+class PostgresTokenBucket:
+    """
+    Token bucket в таблице ratelimitbucket, общий для воркеров API.
+
+    Пополнение и резервирование токена выполняются одним UPDATE,
+    блокировка строки сериализует конкурирующие воркеры.
+    """
+
+    def __init__(self, key: str, rate: float, capacity: float) -> None:
+        self.key = key
+        self.rate = rate
+        self.capacity = capacity
+
+    async def reserve(self) -> float:
+        """Забирает токен и возвращает время ожидания до его появления."""
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                insert(RateLimitBucket).values(
+                    key=self.key, tokens=self.capacity
+                ).on_conflict_do_nothing(
+                    index_elements=[RateLimitBucket.key]
+                )
+            )
+            tokens = (
+                await session.execute(
+                    update(RateLimitBucket).where(
+                        RateLimitBucket.key == self.key
+                    ).values(
+                        tokens=func.least(
+                            self.capacity,
+                            RateLimitBucket.tokens + func.extract(
+                                'epoch',
+                                func.clock_timestamp()
+                                - RateLimitBucket.refilled_at
+                            ) * self.rate
+                        ) - 1,
+                        refilled_at=func.clock_timestamp()
+                    ).returning(RateLimitBucket.tokens)
+                )
+            ).scalar_one()
+            await session.commit()
+        return max(0.0, -tokens / self.rate)
+
+    async def release(self) -> None:
+        """Возвращает неиспользованный токен, не превышая capacity."""
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(RateLimitBucket).where(
+                    RateLimitBucket.key == self.key
+                ).values(
+                    tokens=func.least(
+                        self.capacity, RateLimitBucket.tokens + 1
+                    )
+                )
+            )
+            await session.commit()
+
+
+class RateLimiter:
+    """
+    Ограничитель частоты запросов с отдельным token bucket на ключ.
+
+    Запрос ждет своего токена не дольше max_wait, иначе
+    возвращается ошибка 503, а токен возвращается в bucket.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        max_wait: float,
+        backend: str = LOCAL_BACKEND
+    ) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.max_wait = max_wait
+        self.backend = backend
+        self._buckets = dict()
+
+    def get_bucket(self, key: str):
+        """Возвращает bucket для ключа, создавая его при необходимости."""
+        if key not in self._buckets:
+            if self.backend == POSTGRES_BACKEND:
+                self._buckets[key] = PostgresTokenBucket(
+                    key, self.rate, self.capacity
+                )
+            else:
+                self._buckets[key] = LocalTokenBucket(
+                    self.rate, self.capacity
+                )
+        return self._buckets[key]
+
+    async def acquire(self, key: str) -> None:
+        """Дожидается токена для ключа."""
+        bucket = self.get_bucket(key)
+        wait = await bucket.reserve()
+        if wait > self.max_wait:
+            await bucket.release()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=RATE_LIMIT_EXCEEDED_ERROR.format(key=key)
+            )
+        if not wait:
+            return
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            await bucket.release()
+            raise
+
+    async def acquire_for_url(self, url: str) -> None:
+        """Дожидается токена для хоста из url."""
+        await self.acquire(urlsplit(url).netloc)
+
+
+marketplace_rate_limiter = RateLimiter(
+    rate=settings.marketplace_rate_limit,
+    capacity=settings.marketplace_rate_limit_burst,
+    max_wait=settings.marketplace_rate_limit_max_wait,
+    backend=settings.marketplace_rate_limit_backend
+)
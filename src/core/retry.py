@@ -0,0 +1,38 @@
+"""Модуль с повтором запросов с экспоненциальной задержкой."""
+
+import asyncio
+import random
+from typing import Any, Awaitable, Callable
+
+
+def get_backoff_delay(
+    attempt: int, base_delay: float, max_delay: float
+) -> float:
+    """
+    Задержка перед повтором с экспоненциальным ростом и full jitter.
+
+    Случайная задержка из [0, base_delay * 2 ** attempt] не дает
+    повторам разных запросов совпасть во времени.
+    """
+    return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+
+async def retry_with_backoff(
+    call: Callable[[], Awaitable[Any]],
+    attempts: int,
+    base_delay: float,
+    max_delay: float,
+    is_retryable: Callable[[BaseException], bool]
+) -> Any:
+    """
+    Выполняет call, повторяя его не больше attempts раз.
+
+    Повторяются только ошибки, для которых is_retryable возвращает True.
+    """
+    for attempt in range(attempts):
+        try:
+            return await call()
+        except Exception as error:
+            if attempt == attempts - 1 or not is_retryable(error):
+                raise
+        await asyncio.sleep(get_backoff_delay(attempt, base_delay, max_delay))
@@ -1,14 +1,21 @@
-from typing import Union
+from typing import Any, Optional, Union
 
-from fastapi import Depends
+import jwt
+from fastapi import Depends, HTTPException, Request, status
 from fastapi_users import (BaseUserManager, FastAPIUsers, IntegerIDMixin,
                            InvalidPasswordException)
 from fastapi_users.authentication import (AuthenticationBackend,
                                           BearerTransport, JWTStrategy)
+from fastapi_users.jwt import decode_jwt
 from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
+from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
+from src.core.principal import (UserPrincipal, get_user_principal,
+                                invalidate_user_principal)
+from src.crud.base import LoaderOptions
+from src.crud.user import USER_READ_OPTIONS
 from src.database.db import get_async_session
 from src.models.user import User
 from src.schemas.user import UserCreate
@@ -16,16 +23,48 @@ from src.schemas.user import UserCreate
 BEARER_TRANSPORT_TOKEN_URL = 'auth/jwt/login'
 LIFETIME_SECONDS = 3600
 AUTH_BACKEND_NAME = 'jwt'
+AUTH_USER_MODE_CLAIMS = 'claims'
+AUTH_USER_MODE_DATABASE = 'database'
 
 MIN_PASSWORD_LENGTH = 3
 PASSWORD_LENGTH_ERROR = 'Пароль должен быть длиннее {min_password_length}'
 PASSWORD_DATA_ERROR = 'Пароль не должен содержать данных о пользователе!'
 
 
+class UserDatabase(SQLAlchemyUserDatabase):
+    """
+    Адаптер fastapi-users, загружающий связи пользователя явно.
+
+    Связи User объявлены с lazy='raise', поэтому пользователь
+    загружается с options: по умолчанию только то, что нужно схеме
+    UserRead, без подписок и истории цен.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        user_table: type[User],
+        options: LoaderOptions = USER_READ_OPTIONS
+    ) -> None:
+        super().__init__(session, user_table)
+        self.options = options
+
+    async def _get_user(self, statement: Select) -> Optional[User]:
+        return await super()._get_user(statement.options(*self.options))
+
+    async def create(self, create_dict: dict[str, Any]) -> User:
+        user = await super().create(create_dict)
+        return await self.get(user.id)
+
+    async def update(self, user: User, update_dict: dict[str, Any]) -> User:
+        user = await super().update(user, update_dict)
+        return await self.get(user.id)
+
+
 async def get_user_db(
     session: AsyncSession = Depends(get_async_session)
 ):
-    yield SQLAlchemyUserDatabase(session, User)
+    yield UserDatabase(session, User)
 
 bearer_transport = BearerTransport(tokenUrl=BEARER_TRANSPORT_TOKEN_URL)
 
@@ -61,6 +100,21 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
         #             reason=PASSWORD_DATA_ERROR
         #         )
 
+    async def on_after_update(
+        self,
+        user: User,
+        update_dict: dict[str, Any],
+        request: Optional[Request] = None
+    ) -> None:
+        invalidate_user_principal(user.id)
+
+    async def on_after_delete(
+        self,
+        user: User,
+        request: Optional[Request] = None
+    ) -> None:
+        invalidate_user_principal(user.id)
+
 
 async def get_user_manager(user_db=Depends(get_user_db)):
     yield UserManager(user_db)
@@ -71,5 +125,49 @@ fastapi_users = FastAPIUsers[User, int](
     [auth_backend]
 )
 
-current_user = fastapi_users.current_user(active=True)
-current_superuser = fastapi_users.current_user(active=True, superuser=True)
+
+def get_current_principal(superuser: bool = False):
+    """
+    Зависимость, авторизующая запрос по проверенным claims JWT.
+
+    Подпись и срок действия токена проверяются так же, как в
+    JWTStrategy, а пользователь берется из кэша UserPrincipal без
+    загрузки User из БД. Ошибки совпадают с ошибками fastapi-users.
+    """
+    async def current_principal(
+        token: Optional[str] = Depends(bearer_transport.scheme),
+        session: AsyncSession = Depends(get_async_session)
+    ) -> UserPrincipal:
+        if token is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+        strategy = get_jwt_strategy()
+        try:
+            user_id = int(decode_jwt(
+                token,
+                strategy.decode_key,
+                strategy.token_audience,
+                algorithms=[strategy.algorithm]
+            )['sub'])
+        except (jwt.PyJWTError, KeyError, ValueError):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+        principal = await get_user_principal(user_id, session)
+        if principal is None or not principal.is_active:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+        if superuser and not principal.is_superuser:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+        return principal
+
+    return current_principal
+
+
+# Полный объект User из БД: для эндпоинтов, которые изменяют пользователя.
+current_db_user = fastapi_users.current_user(active=True)
+
+if settings.auth_user_mode == AUTH_USER_MODE_CLAIMS:
+    current_user = get_current_principal()
+    current_superuser = get_current_principal(superuser=True)
+else:
+    current_user = current_db_user
+    current_superuser = fastapi_users.current_user(
+        active=True, superuser=True
+    )
@@ -1,12 +1,13 @@
 """Модуль с базовыми классами CRUD-операций."""
 
-from typing import Generic, Optional, Type, TypeVar
+from typing import Generic, Optional, Sequence, Type, TypeVar
 
 from fastapi import HTTPException, status
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.base import ExecutableOption
 
 from src.models.base import Base
 
@@ -19,40 +20,81 @@ UPDATE_ERROR_MESSAGE = (
 SERVER_ERROR_MESSAGE = (
     'Возникла ошибка сервера при создании объекта! Текст ошибки {error}'
 )
+OBJECT_NOT_FOUND_ERROR_MESSAGE = 'Объекта с id = {id} не существует!'
 
 
 ModelType = TypeVar('Modeltype', bound=Base)
 CreateSchemaType = TypeVar('CreateSchemaType', bound=BaseModel)
 UpdateSchemaType = TypeVar('UpdateSchemaType', bound=BaseModel)
+LoaderOptions = Sequence[ExecutableOption]
 
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """Базовый CRUD-класс."""
 
+    not_found_error_message = OBJECT_NOT_FOUND_ERROR_MESSAGE
+
     def __init__(self, model: Type[ModelType]) -> None:
         """Инициализирует CRUD-класс с указанной моделью."""
         self.model = model
 
+    def get_query(self, options: LoaderOptions = ()) -> Select:
+        """
+        Запрос объектов модели с указанными стратегиями загрузки связей.
+
+        Связи моделей объявлены с lazy='raise': эндпоинт передает
+        в options (joinedload, selectinload) только нужные ему связи,
+        а обращение к незагруженной связи вызывает ошибку.
+        """
+        return select(self.model).options(*options)
+
     async def get_all(
-        self, session: AsyncSession
+        self,
+        session: AsyncSession,
+        options: LoaderOptions = ()
     ) -> Optional[list[ModelType]]:
         """Возвращает все объекты модели."""
         return (
-            await session.execute(select(self.model))
+            await session.execute(self.get_query(options))
         ).scalars().all()
 
     async def get(
         self,
         object_id: int,
-        session: AsyncSession
+        session: AsyncSession,
+        options: LoaderOptions = ()
     ) -> Optional[ModelType]:
         """Получение объекта по id."""
         return (
             await session.execute(
-                select(self.model).where(self.model.id == object_id)
+                self.get_query(options).where(self.model.id == object_id)
             )
         ).scalar()
 
+    async def get_or_404(
+        self,
+        object_id: int,
+        session: AsyncSession,
+        owner_id: Optional[int] = None,
+        options: LoaderOptions = ()
+    ) -> ModelType:
+        """
+        Получение объекта по id одним запросом или ошибка 404.
+
+        Если передан owner_id, запрос ограничивается объектами
+        с этим user_id: чужой объект неотличим от несуществующего.
+        """
+        query = self.get_query(options).where(self.model.id == object_id)
+        if owner_id is not None:
+            query = query.where(self.model.user_id == owner_id)
+        db_object = (await session.execute(query)).scalar()
+        if db_object is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=self.not_found_error_message.format(id=object_id)
+            )
+        return db_object
+
     async def create(
         self,
         create_schema: CreateSchemaType,
@@ -91,11 +133,19 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         session: AsyncSession,
         commit_on: bool = True
     ) -> ModelType:
-        """Обновляет существующий объект (частичное обновение)."""
+        """
+        Обновляет существующий объект (частичное обновение).
+
+        Если значения полей не изменились, объект не записывается в БД.
+        """
         update_data = update_schema.model_dump(exclude_unset=True)
+        changed = False
         for field, value in update_data.items():
-            if field in update_data:
+            if getattr(db_object, field) != value:
                 setattr(db_object, field, value)
+                changed = True
+        if not changed:
+            return db_object
         try:
             session.add(db_object)
             if commit_on:
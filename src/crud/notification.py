@@ -0,0 +1,65 @@
+"""Модуль с инициализацией CRUD-класса для подписок на уведомления."""
+
+from datetime import timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.crud.base import CRUDBase
+from src.models.jwt_auth import JWTToken
+from src.models.notification import NotificationSubscription
+from src.schemas.notification import (NotificationSubscriptionCreate,
+                                      NotificationSubscriptionUpdate)
+
+
+class NotificationSubscriptionCRUD(
+    CRUDBase[
+        NotificationSubscription,
+        NotificationSubscriptionCreate,
+        NotificationSubscriptionUpdate
+    ]
+):
+    async def get_subscription_by_user_id(
+        self,
+        user_id: int,
+        session: AsyncSession
+    ):
+        """Возвращает подписку пользователя."""
+        return (
+            await session.execute(
+                select(self.model).where(self.model.user_id == user_id)
+            )
+        ).scalar()
+
+    async def get_enabled_with_tokens(
+        self,
+        offset: int,
+        limit: int,
+        token_lifetime: int,
+        session: AsyncSession
+    ):
+        """
+        Возвращает страницу включенных подписок.
+
+        Вместе с подпиской возвращается зашифрованный JWT-токен
+        пользователя. Подписки пользователей без токена или с токеном,
+        выданным раньше token_lifetime секунд назад, пропускаются:
+        проверки по ним все равно получат 401.
+        """
+        return (
+            await session.execute(
+                select(self.model, JWTToken.access_token).join(
+                    JWTToken, JWTToken.user_id == self.model.user_id
+                ).where(
+                    self.model.enabled.is_(True),
+                    JWTToken.updated_at > func.now() - timedelta(
+                        seconds=token_lifetime
+                    )
+                ).order_by(self.model.id).offset(offset).limit(limit)
+            )
+        ).all()
+
+
+notification_subscription_crud = NotificationSubscriptionCRUD(
+    NotificationSubscription
+)
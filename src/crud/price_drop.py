@@ -0,0 +1,35 @@
+"""Модуль с инициализацией CRUD-класса для событий снижения цены."""
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.crud.base import CRUDBase
+from src.models.price_drop import PriceDropEvent
+from src.schemas.price_drop import PriceDropEventCreate
+
+
+class PriceDropEventCRUD(
+    CRUDBase[PriceDropEvent, PriceDropEventCreate, PriceDropEventCreate]
+):
+    async def create_many_if_not_exists(
+        self,
+        create_schemas: list[PriceDropEventCreate],
+        session: AsyncSession
+    ) -> None:
+        """
+        Добавляет события в outbox одним INSERT без коммита.
+
+        События с уже существующим idempotency_key не создаются.
+        """
+        if not create_schemas:
+            return
+        await session.execute(
+            insert(self.model).values(
+                [create_schema.model_dump() for create_schema in create_schemas]
+            ).on_conflict_do_nothing(
+                index_elements=[self.model.idempotency_key]
+            )
+        )
+
+
+price_drop_event_crud = PriceDropEventCRUD(PriceDropEvent)
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.crud.base import CRUDBase
 from src.models.price_history import PriceHistory
+from src.models.track import Track
 from src.schemas.price_history import PriceHistoryCreate, PriceHistoryUpdate
 
 THE_OLDEST_DELETE_ERROR_MESSAGE = (
@@ -22,19 +23,40 @@ class PriceHistoryCRUD(
         session: AsyncSession
     ):
         result = await session.execute(
-            select(self.model).where(self.model.track_id == track_id)
+            select(self.model).where(
+                self.model.track_id == track_id
+            ).order_by(self.model.created_at)
         )
         return result.scalars().all()
 
+    async def get_history_by_product_ids(
+        self,
+        product_ids: list[int],
+        session: AsyncSession
+    ):
+        """Возвращает историю цен товаров по всем их подпискам."""
+        result = await session.execute(
+            select(
+                Track.product_id, self.model.created_at, self.model.price
+            ).join(
+                Track, Track.id == self.model.track_id
+            ).where(Track.product_id.in_(product_ids))
+        )
+        return result.all()
+
     async def delete_the_oldest_price_history(
         self,
+        track_id: int,
         session: AsyncSession,
         commit_on: bool = True
     ):
+        """Удаляет самую старую запись в истории товара."""
         try:
             the_oldest_price_history = (
                 await session.execute(
-                    select(self.model).order_by(asc(self.model.created_at))
+                    select(self.model).where(
+                        self.model.track_id == track_id
+                    ).order_by(asc(self.model.created_at)).limit(1)
                 )
             ).scalar()
             await session.delete(the_oldest_price_history)
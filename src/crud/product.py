@@ -0,0 +1,69 @@
+"""Модуль с инициализацией CRUD-класса для модели Product."""
+
+from datetime import datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.crud.base import CRUDBase
+from src.models.product import Product
+from src.schemas.product import ProductCreate, ProductUpdate
+
+
+class ProductCRUD(CRUDBase[Product, ProductCreate, ProductUpdate]):
+    async def get_product_by_marketplace_and_article(
+        self,
+        marketplace: str,
+        article: str,
+        session: AsyncSession
+    ):
+        """Ищет товар по маркетплейсу и артикулу."""
+        return (
+            await session.execute(
+                select(self.model).where(
+                    self.model.marketplace == marketplace,
+                    self.model.article == article
+                )
+            )
+        ).scalar()
+
+    async def get_or_create(
+        self,
+        create_schema: ProductCreate,
+        session: AsyncSession
+    ) -> Product:
+        """
+        Возвращает товар по маркетплейсу и артикулу.
+
+        Если товара нет, создает его. Одновременное создание одного
+        товара несколькими пользователями не приводит к ошибке.
+        """
+        await session.execute(
+            insert(self.model).values(
+                **create_schema.model_dump()
+            ).on_conflict_do_nothing(
+                index_elements=[self.model.marketplace, self.model.article]
+            )
+        )
+        return await self.get_product_by_marketplace_and_article(
+            create_schema.marketplace, create_schema.article, session
+        )
+
+    async def update_last_checked_at(
+        self,
+        product_ids: list[int],
+        checked_at: datetime,
+        session: AsyncSession
+    ) -> None:
+        """Обновляет время проверки товаров одним UPDATE без коммита."""
+        if not product_ids:
+            return
+        await session.execute(
+            update(self.model).where(
+                self.model.id.in_(product_ids)
+            ).values(last_checked_at=checked_at)
+        )
+
+
+product_crud = ProductCRUD(Product)
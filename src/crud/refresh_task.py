@@ -0,0 +1,131 @@
+"""Модуль с инициализацией CRUD-класса для очереди обновления товаров."""
+
+from datetime import datetime, timedelta
+
+from pydantic import BaseModel
+from sqlalchemy import Select, delete, exists, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.crud.base import CRUDBase
+from src.models.product import Product
+from src.models.refresh_task import RefreshTask
+from src.models.track import Track
+
+
+class RefreshTaskCRUD(CRUDBase[RefreshTask, BaseModel, BaseModel]):
+    async def enqueue_due_products(self, session: AsyncSession) -> None:
+        """
+        Ставит в очередь товары, цену которых пора проверить.
+
+        Учитываются только товары с активными подписками,
+        товар уже в очереди повторно не добавляется.
+        """
+        await session.execute(
+            insert(self.model).from_select(
+                [self.model.product_id],
+                select(Product.id).where(
+                    or_(
+                        Product.next_check_at.is_(None),
+                        Product.next_check_at <= datetime.now()
+                    ),
+                    exists().where(
+                        Track.product_id == Product.id,
+                        Track.is_active.is_(True)
+                    )
+                )
+            ).on_conflict_do_nothing(
+                index_elements=[self.model.product_id]
+            )
+        )
+
+    async def claim_tasks(
+        self,
+        available_tasks: Select,
+        visibility_timeout: float,
+        session: AsyncSession
+    ) -> list[int]:
+        """
+        Забирает задачи из available_tasks (FOR UPDATE SKIP LOCKED).
+
+        Задачи скрываются от других воркеров на visibility_timeout
+        секунд. Возвращает id товаров.
+        """
+        return (
+            await session.execute(
+                update(self.model).where(
+                    self.model.id.in_(
+                        available_tasks.with_for_update(
+                            skip_locked=True
+                        ).scalar_subquery()
+                    )
+                ).values(
+                    attempts=self.model.attempts + 1,
+                    available_at=func.now() + timedelta(
+                        seconds=visibility_timeout
+                    )
+                ).returning(self.model.product_id)
+            )
+        ).scalars().all()
+
+    async def claim(
+        self,
+        batch_size: int,
+        visibility_timeout: float,
+        session: AsyncSession
+    ) -> list[int]:
+        """Забирает пачку доступных задач в порядке available_at."""
+        return await self.claim_tasks(
+            select(self.model.id).where(
+                self.model.available_at <= func.now()
+            ).order_by(
+                self.model.available_at
+            ).limit(batch_size),
+            visibility_timeout,
+            session
+        )
+
+    async def claim_products(
+        self,
+        product_ids: list[int],
+        visibility_timeout: float,
+        session: AsyncSession
+    ) -> list[int]:
+        """
+        Ставит товары в очередь и забирает их задачи.
+
+        Задачи, которые уже забрал воркер, пропускаются: такой товар
+        обновляется воркером. Возвращает id забранных товаров.
+        """
+        if not product_ids:
+            return []
+        await session.execute(
+            insert(self.model).values(
+                [dict(product_id=product_id) for product_id in product_ids]
+            ).on_conflict_do_nothing(
+                index_elements=[self.model.product_id]
+            )
+        )
+        return await self.claim_tasks(
+            select(self.model.id).where(
+                self.model.product_id.in_(product_ids),
+                self.model.available_at <= func.now()
+            ),
+            visibility_timeout,
+            session
+        )
+
+    async def delete_by_product_ids(
+        self,
+        product_ids: list[int],
+        session: AsyncSession
+    ) -> None:
+        """Удаляет выполненные задачи без коммита."""
+        await session.execute(
+            delete(self.model).where(
+                self.model.product_id.in_(product_ids)
+            )
+        )
+
+
+refresh_task_crud = RefreshTaskCRUD(RefreshTask)
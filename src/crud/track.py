@@ -1,21 +1,44 @@
 """Модуль с инициализацией CRUD-класса для модели Track."""
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 
-from src.crud.base import CRUDBase
+from src.crud.base import CRUDBase, LoaderOptions
+from src.models.product import Product
 from src.models.track import Track
+from src.models.user import User
 from src.schemas.track import TrackDBCreate, TrackUpdate
 
+# Связи для схемы TrackDB: пользователь с токеном (Product загружается
+# вместе с подпиской всегда).
+TRACK_READ_OPTIONS = (
+    joinedload(Track.user).joinedload(User.jwt_token),
+)
+# Дополнительно история цен: нужна при обновлении данных о товарах.
+TRACK_WITH_HISTORY_OPTIONS = (
+    *TRACK_READ_OPTIONS,
+    selectinload(Track.price_history),
+)
+
+TRACK_NOT_FOUND_ERROR_MESSAGE = 'Товара с id = {id} не существует!'
+
 
 class TrackCRUD(CRUDBase[Track, TrackDBCreate, TrackUpdate]):
-    async def get_all(self, filter_schema, session: AsyncSession):
+    not_found_error_message = TRACK_NOT_FOUND_ERROR_MESSAGE
+
+    async def get_all(
+        self,
+        filter_schema,
+        session: AsyncSession,
+        options: LoaderOptions = ()
+    ):
         """
         Возвращает товары определенного пользователя.
 
         Дополнительно есть фильтрация.
         """
-        query = select(self.model)
+        query = self.get_query(options)
         filters = [self.model.user_id == filter_schema.user_id]
         if filter_schema.marketplace:
             filters.append(
@@ -29,18 +52,85 @@ class TrackCRUD(CRUDBase[Track, TrackDBCreate, TrackUpdate]):
             query = query.where(and_(*filters))
         return (await session.execute(query)).scalars().all()
 
+    async def get_active_tracks_by_product_ids(
+        self,
+        product_ids: list[int],
+        session: AsyncSession,
+        options: LoaderOptions = ()
+    ):
+        """Возвращает активные подписки на товары."""
+        return (
+            await session.execute(
+                self.get_query(options).where(
+                    self.model.product_id.in_(product_ids),
+                    self.model.is_active.is_(True)
+                )
+            )
+        ).scalars().all()
+
+    async def get_target_prices_by_product_ids(
+        self,
+        product_ids: list[int],
+        session: AsyncSession
+    ):
+        """Возвращает желаемые цены всех подписчиков товаров."""
+        return (
+            await session.execute(
+                select(self.model.product_id, self.model.target_price).where(
+                    self.model.product_id.in_(product_ids)
+                )
+            )
+        ).all()
+
+    async def update_notified(
+        self,
+        track_ids: list[int],
+        session: AsyncSession
+    ):
+        """
+        Пересчитывает флаг notified одним UPDATE без коммита.
+
+        Обновляются только подписки, у которых флаг изменился.
+        Возвращает их id, user_id, article, новый notified,
+        желаемую цену и время изменения (updated_at).
+        """
+        target_price_reached = Product.current_price <= self.model.target_price
+        return (
+            await session.execute(
+                update(self.model).where(
+                    self.model.id.in_(track_ids),
+                    self.model.product_id == Product.id,
+                    self.model.notified.is_distinct_from(
+                        target_price_reached
+                    )
+                ).values(
+                    notified=target_price_reached
+                ).returning(
+                    self.model.id,
+                    self.model.user_id,
+                    self.model.article,
+                    self.model.notified,
+                    self.model.target_price,
+                    self.model.updated_at
+                ).execution_options(synchronize_session=False)
+            )
+        ).all()
+
     async def get_track_by_artice_and_marketplace(
         self,
         article: str,
         marketplace: str,
-        session: AsyncSession
+        user_id: int,
+        session: AsyncSession,
+        options: LoaderOptions = ()
     ):
-        """Ищет товар по артикулу и маркетплейсу."""
+        """Ищет товар пользователя по артикулу и маркетплейсу."""
         return (
             await session.execute(
-                select(self.model).where(
+                self.get_query(options).where(
                     self.model.article == article,
-                    self.model.marketplace == marketplace
+                    self.model.marketplace == marketplace,
+                    self.model.user_id == user_id
                 )
             )
         ).scalar()
@@ -1,21 +1,29 @@
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 
-from src.crud.base import CRUDBase
+from src.crud.base import CRUDBase, LoaderOptions
 from src.models.user import User
 from src.schemas.user import UserCreate, UserUpdate
 
+# Связи для схемы UserRead: токен и аватары, без подписок.
+USER_READ_OPTIONS = (
+    joinedload(User.jwt_token),
+    selectinload(User.media),
+)
+
 
 class UserCRUD(CRUDBase[User, UserCreate, UserUpdate]):
     async def get_user_by_telegram_id(
         self,
         telegram_id: int,
-        session: AsyncSession
+        session: AsyncSession,
+        options: LoaderOptions = ()
     ):
         """Получение пользователя по его telegram-id."""
         return (
             await session.execute(
-                select(self.model).where(
+                self.get_query(options).where(
                     self.model.telegram_id == telegram_id
                 )
             )
@@ -24,16 +32,36 @@ class UserCRUD(CRUDBase[User, UserCreate, UserUpdate]):
     async def get_user_by_email(
         self,
         email: str,
-        session: AsyncSession
+        session: AsyncSession,
+        options: LoaderOptions = ()
     ):
         """Получение пользователя по его email."""
         return (
             await session.execute(
-                select(self.model).where(
+                self.get_query(options).where(
                     self.model.email == email
                 )
             )
         ).scalar()
 
+    async def get_principal_data(
+        self,
+        user_id: int,
+        session: AsyncSession
+    ):
+        """Возвращает только поля пользователя, нужные для авторизации."""
+        return (
+            await session.execute(
+                select(
+                    self.model.id,
+                    self.model.email,
+                    self.model.is_active,
+                    self.model.is_superuser,
+                    self.model.is_verified,
+                    self.model.telegram_id
+                ).where(self.model.id == user_id)
+            )
+        ).first()
+
 
 user_crud = UserCRUD(User)
@@ -1,9 +1,15 @@
 from src.models.base import Base  # noqa
+from src.models.notification import NotificationSubscription  # noqa
+from src.models.price_drop import PriceDropEvent  # noqa
 from src.models.price_history import PriceHistory  # noqa
+from src.models.product import Product  # noqa
+from src.models.rate_limit import RateLimitBucket  # noqa
+from src.models.refresh_task import RefreshTask  # noqa
 from src.models.track import Track  # noqa
 from src.models.user import User  # noqa
-from src.models.user_track import UserTrack  # noqa
 
 __all__ = [
-    'Base', 'User', 'Track', 'PriceHistory', 'UserTrack', 'JWTToken'
+    'Base', 'User', 'Product', 'Track', 'PriceHistory', 'JWTToken',
+    'NotificationSubscription', 'RateLimitBucket', 'PriceDropEvent',
+    'RefreshTask'
 ]
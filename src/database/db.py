@@ -1,13 +1,43 @@
 """Файл с настройками БД."""
 
 from typing import Any, AsyncGenerator
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from src.core.config import settings
+from src.database.pool import InstrumentedAsyncAdaptedQueuePool
 
-engine = create_async_engine(settings.database_url)
+
+def get_connect_args() -> dict[str, Any]:
+    """
+    Параметры подключения asyncpg.
+
+    PgBouncer в режиме transaction pooling выдает каждой транзакции
+    любое серверное соединение, поэтому подготовленные запросы
+    asyncpg в нем не работают: кэши отключаются, а имена
+    подготовленных запросов делаются уникальными.
+    """
+    if not settings.database_pgbouncer:
+        return dict()
+    return dict(
+        statement_cache_size=0,
+        prepared_statement_cache_size=0,
+        prepared_statement_name_func=lambda: f'__asyncpg_{uuid4()}__',
+    )
+
+
+engine = create_async_engine(
+    settings.database_url,
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    pool_timeout=settings.database_pool_timeout,
+    pool_recycle=settings.database_pool_recycle,
+    pool_pre_ping=settings.database_pool_pre_ping,
+    connect_args=get_connect_args()
+)
 AsyncSessionLocal = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
@@ -0,0 +1,68 @@
+"""Модуль с пулом соединений БД, собирающим метрики ожидания."""
+
+import time
+from collections import deque
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+RECENT_WAITS_MAXLEN = 1000
+WAIT_PERCENTILE = 0.95
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool со счетчиками выдачи соединений.
+
+    Время ожидания измеряется от запроса соединения до его получения,
+    включая ожидание свободного соединения и создание нового.
+    Перцентиль и среднее считаются по последним RECENT_WAITS_MAXLEN
+    выдачам, поэтому отражают текущую нагрузку.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.recent_waits: deque[float] = deque(maxlen=RECENT_WAITS_MAXLEN)
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at = time.monotonic()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        wait = time.monotonic() - started_at
+        self.checkouts += 1
+        self.wait_seconds_total += wait
+        self.wait_seconds_max = max(self.wait_seconds_max, wait)
+        self.recent_waits.append(wait)
+        return connection
+
+    def stats(self) -> dict[str, Any]:
+        """Возвращает состояние пула и счетчики ожидания соединений."""
+        recent_waits = sorted(self.recent_waits)
+        return dict(
+            size=self.size(),
+            max_overflow=self._max_overflow,
+            timeout=self._timeout,
+            checked_in=self.checkedin(),
+            checked_out=self.checkedout(),
+            overflow=max(self.overflow(), 0),
+            checkouts=self.checkouts,
+            timeouts=self.timeouts,
+            wait_seconds_total=self.wait_seconds_total,
+            wait_seconds_max=self.wait_seconds_max,
+            recent_wait_seconds_avg=(
+                sum(recent_waits) / len(recent_waits)
+                if recent_waits else 0.0
+            ),
+            recent_wait_seconds_p95=(
+                recent_waits[int(len(recent_waits) * WAIT_PERCENTILE)]
+                if recent_waits else 0.0
+            ),
+        )
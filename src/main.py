@@ -8,6 +8,7 @@ from fastapi.staticfiles import StaticFiles
 
 from src.api.v1.routers import main_router
 from src.core.config import STATIC_DIR, UPLOAD_DIR, settings
+from src.core.http_client import marketplace_client
 from src.core.init_db import create_first_superuser
 
 
@@ -19,7 +20,9 @@ os.makedirs(UPLOAD_DIR, exist_ok=True)
 async def lifespan(app: FastAPI):
     print(f'Приложение запущено! Дата: {datetime.now()}')
     await create_first_superuser()
+    await marketplace_client.start()
     yield
+    await marketplace_client.close()
     print(f'Приложение остановлено! Дата: {datetime.now()}')
 
 
@@ -0,0 +1,287 @@
+"""Модуль с базовым адаптером маркетплейса."""
+
+import asyncio
+from typing import Any, Hashable, Iterable, Optional, Union
+from urllib.parse import urlsplit
+
+import aiohttp
+from fastapi import HTTPException, status
+
+from src.api.v1.validators import check_not_existent_article
+from src.core.cache import TTLCache
+from src.core.circuit_breaker import CircuitBreakerRegistry
+from src.core.config import settings
+from src.core.http_client import marketplace_client
+from src.core.rate_limit import RateLimiter
+from src.core.retry import retry_with_backoff
+from src.database.enums import Marketplace
+from src.schemas.product import ProductCreate, ProductUpdate
+
+MARKETPLACE_UNAVAILABLE_ERROR = (
+    'Маркетплейс временно недоступен. Текст ошибки: {error}'
+)
+MARKETPLACE_CIRCUIT_OPEN_ERROR = (
+    'Запросы к {host} временно приостановлены из-за ошибок маркетплейса.'
+)
+
+marketplace_circuit_breakers = CircuitBreakerRegistry(
+    failure_threshold=settings.marketplace_breaker_failure_threshold,
+    recovery_timeout=settings.marketplace_breaker_recovery_timeout
+)
+
+card_cache = TTLCache(
+    ttl=settings.card_cache_ttl, maxsize=settings.card_cache_maxsize
+)
+
+
+class MarketplaceCards(dict):
+    """
+    Карточки товаров маркетплейса по артикулам.
+
+    Дополнительно хранит список артикулов, для которых карточка
+    не была найдена (missing), и тех из них, запрос которых
+    завершился ошибкой маркетплейса (failed).
+    """
+
+    def __init__(
+        self,
+        cards: dict[str, Any],
+        missing: list[str],
+        failed: Optional[list[str]] = None
+    ) -> None:
+        super().__init__(cards)
+        self.missing = missing
+        self.failed = failed or list()
+
+
+def split_into_batches(
+    articles: list[str], batch_size: int
+) -> list[list[str]]:
+    """Разбивает список артикулов на пачки заданного размера."""
+    return [
+        articles[index:index + batch_size]
+        for index in range(0, len(articles), batch_size)
+    ]
+
+
+def is_marketplace_failure(error: BaseException) -> bool:
+    """
+    Проверяет, говорит ли ошибка о сбое маркетплейса.
+
+    Такие ошибки повторяются и учитываются выключателем хоста,
+    в отличие от ответов 4xx на корректно обработанный запрос.
+    """
+    if isinstance(error, aiohttp.ClientResponseError):
+        return (
+            error.status >= status.HTTP_500_INTERNAL_SERVER_ERROR
+            or error.status == status.HTTP_429_TOO_MANY_REQUESTS
+        )
+    return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+class MarketplaceAdapter:
+    """
+    Базовый адаптер маркетплейса.
+
+    Реализует общий путь получения карточек: кэш, разбиение на пачки
+    по batch_size, не больше concurrency пачек одновременно, лимит
+    запросов rate_limiter, таймаут timeout на запрос, повторы и
+    выключатель хоста. Наследник задает marketplace и реализует
+    get_batch_url, decode_cards и get_product_data.
+    """
+
+    marketplace: Marketplace
+
+    def __init__(
+        self,
+        batch_size: int,
+        concurrency: int,
+        timeout: float,
+        rate_limiter: RateLimiter
+    ) -> None:
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+
+    def get_batch_url(self, articles: list[str]) -> str:
+        """Адрес запроса карточек пачки товаров."""
+        raise NotImplementedError
+
+    def decode_cards(self, payload: bytes) -> dict[str, Any]:
+        """Извлекает карточки из ответа маркетплейса по артикулам."""
+        raise NotImplementedError
+
+    def get_product_data(
+        self,
+        product_schema: Union[ProductCreate, ProductUpdate],
+        card: Any
+    ) -> Union[ProductCreate, ProductUpdate]:
+        """Заполняет поля объекта Product по карточке товара."""
+        raise NotImplementedError
+
+    def get_cache_key(self, article: str) -> Hashable:
+        """Ключ кэша карточки."""
+        return self.marketplace, article
+
+    async def request_batch(self, url: str) -> dict[str, Any]:
+        """
+        Выполняет один запрос карточек через выключатель хоста.
+
+        Запрос ограничен timeout, превышение считается сбоем хоста.
+        Пока выключатель разомкнут, запрос отклоняется с ошибкой 503.
+        """
+        host = urlsplit(url).netloc
+        circuit_breaker = marketplace_circuit_breakers.get(host)
+        if not circuit_breaker.allow_request():
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=MARKETPLACE_CIRCUIT_OPEN_ERROR.format(host=host)
+            )
+        try:
+            await self.rate_limiter.acquire(host)
+            async with asyncio.timeout(self.timeout):
+                async with marketplace_client.session.get(url) as response:
+                    response.raise_for_status()
+                    payload = await response.read()
+        except BaseException as error:
+            if is_marketplace_failure(error):
+                circuit_breaker.record_failure()
+            else:
+                circuit_breaker.release()
+            raise
+        circuit_breaker.record_success()
+        return self.decode_cards(payload)
+
+    async def fetch_batch(self, articles: list[str]) -> dict[str, Any]:
+        """
+        Запрашивает карточки пачки товаров одним запросом.
+
+        Сбои маркетплейса повторяются с экспоненциальной задержкой,
+        после исчерпания попыток возвращается ошибка 503.
+        """
+        url = self.get_batch_url(articles)
+        try:
+            return await retry_with_backoff(
+                lambda: self.request_batch(url),
+                attempts=settings.marketplace_retry_attempts,
+                base_delay=settings.marketplace_retry_base_delay,
+                max_delay=settings.marketplace_retry_max_delay,
+                is_retryable=is_marketplace_failure
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=MARKETPLACE_UNAVAILABLE_ERROR.format(error=repr(error))
+            ) from error
+
+    async def fetch_batches(
+        self, articles: list[str]
+    ) -> tuple[dict[str, Any], list[str]]:
+        """
+        Запрашивает карточки пачками по batch_size конкурентно.
+
+        Одновременно выполняется не больше concurrency пачек. Ошибка
+        одной пачки не прерывает остальные. Возвращает найденные
+        карточки и артикулы из пачек с ошибкой. Если не удалось
+        получить ни одну пачку, возвращается ошибка 503.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch_batch(batch: list[str]) -> dict[str, Any]:
+            async with semaphore:
+                return await self.fetch_batch(batch)
+
+        batches = split_into_batches(articles, self.batch_size)
+        fetched_batches = await asyncio.gather(
+            *[fetch_batch(batch) for batch in batches],
+            return_exceptions=True
+        )
+        errors = [
+            fetched_batch for fetched_batch in fetched_batches
+            if isinstance(fetched_batch, BaseException)
+        ]
+        if errors and len(errors) == len(fetched_batches):
+            if isinstance(errors[0], HTTPException):
+                raise errors[0]
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=MARKETPLACE_UNAVAILABLE_ERROR.format(
+                    error=repr(errors[0])
+                )
+            ) from errors[0]
+        fetched_cards = dict()
+        failed_articles = list()
+        for batch, fetched_batch in zip(batches, fetched_batches):
+            if isinstance(fetched_batch, BaseException):
+                failed_articles.extend(batch)
+            else:
+                fetched_cards.update(fetched_batch)
+        return fetched_cards, failed_articles
+
+    async def fetch_many(self, articles: Iterable[str]) -> MarketplaceCards:
+        """
+        Получает карточки товаров по списку артикулов.
+
+        Карточки берутся из кэша, а промахи запрашиваются пачками.
+        Одновременные запросы одного артикула объединяются.
+        """
+        articles = list(dict.fromkeys(articles))
+        if not articles:
+            return MarketplaceCards(cards=dict(), missing=list())
+        cache_keys = {
+            self.get_cache_key(article): article for article in articles
+        }
+        failed_articles = list()
+
+        async def load_cards(keys: list[Hashable]) -> dict[Hashable, Any]:
+            fetched_cards, failed_batches_articles = (
+                await self.fetch_batches([cache_keys[key] for key in keys])
+            )
+            failed_articles.extend(failed_batches_articles)
+            return {
+                self.get_cache_key(article): card
+                for article, card in fetched_cards.items()
+            }
+
+        cached_cards = await card_cache.get_many_or_load(
+            cache_keys, load_cards
+        )
+        fetched_cards = {
+            cache_keys[key]: card for key, card in cached_cards.items()
+        }
+        return MarketplaceCards(
+            cards={
+                article: fetched_cards[article]
+                for article in articles if article in fetched_cards
+            },
+            missing=[
+                article for article in articles
+                if article not in fetched_cards
+            ],
+            failed=failed_articles
+        )
+
+    async def fetch_many_or_stale(
+        self, articles: list[str]
+    ) -> MarketplaceCards:
+        """
+        Получает карточки, не прерываясь на недоступности маркетплейса.
+
+        Если маркетплейс недоступен (503), все артикулы считаются failed:
+        для них остаются последние сохраненные в БД данные.
+        """
+        try:
+            return await self.fetch_many(articles)
+        except HTTPException as error:
+            if error.status_code != status.HTTP_503_SERVICE_UNAVAILABLE:
+                raise
+            return MarketplaceCards(
+                cards=dict(), missing=list(articles), failed=list(articles)
+            )
+
+    async def fetch_one(self, article: str) -> Any:
+        """Получает карточку товара по его артикулу."""
+        cards = await self.fetch_many([article])
+        check_not_existent_article(article, cards)
+        return cards[article]
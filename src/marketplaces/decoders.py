@@ -0,0 +1,60 @@
+"""Модуль с декодером ответов маркетплейса."""
+
+from typing import Any, Optional
+
+import orjson
+
+WILDBERRIES_PAYLOAD_ERROR = (
+    'Некорректный ответ маркетплейса. Текст ошибки: {error}'
+)
+
+
+class WildberriesCard:
+    """
+    Компактная карточка товара Wildberries.
+
+    Хранит только поля, нужные для обновления товара: артикул,
+    название и цену со скидкой в копейках (salePriceU).
+    """
+
+    __slots__ = ('id', 'name', 'sale_price_u')
+
+    def __init__(
+        self, id: str, name: Optional[str], sale_price_u: Any
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.sale_price_u = sale_price_u
+
+    def __repr__(self) -> str:
+        return (
+            f'WildberriesCard(id={self.id!r}, name={self.name!r}, '
+            f'sale_price_u={self.sale_price_u!r})'
+        )
+
+
+class WildberriesPayloadError(ValueError):
+    """Ответ маркетплейса не соответствует ожидаемому формату."""
+
+
+def decode_wildberries_cards(payload: bytes) -> dict[str, WildberriesCard]:
+    """
+    Извлекает карточки из ответа card.wb.ru по артикулам.
+
+    Ответ разбирается orjson, из каждой карточки сразу берутся только
+    нужные поля, остальная часть ответа не сохраняется.
+    """
+    try:
+        products = orjson.loads(payload)['data']['products']
+        return {
+            str(product['id']): WildberriesCard(
+                id=str(product['id']),
+                name=product.get('name'),
+                sale_price_u=product.get('salePriceU')
+            )
+            for product in products
+        }
+    except (orjson.JSONDecodeError, KeyError, TypeError) as error:
+        raise WildberriesPayloadError(
+            WILDBERRIES_PAYLOAD_ERROR.format(error=repr(error))
+        ) from error
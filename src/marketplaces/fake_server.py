@@ -0,0 +1,299 @@
+"""
+Локальный заменитель card.wb.ru для нагрузочного тестирования.
+
+Отдает ответы в формате card.wb.ru по тем же путям и параметрам, что
+и WILDBERRIES_PRODUCT_CARD_URL. Карточки берутся из файла фикстур или
+генерируются по артикулу. Задержка, доля ошибок 5xx, ответы 429 и
+дрейф цен настраиваются аргументами командной строки. Запуск:
+
+    python -m src.marketplaces.fake_server --port 8081 \\
+        --latency lognormal --latency-mean 0.2 --error-rate 0.05
+
+и в .env:
+
+    WILDBERRIES_PRODUCT_CARD_URL=http://127.0.0.1:8081/cards/v1/detail?appType=1&curr=rub&dest={dest}&spp=30&nm={nm_id}
+"""  # noqa: E501
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import zlib
+from collections import Counter
+from typing import Optional
+
+from aiohttp import web
+
+CARDS_PATH = '/cards/v1/detail'
+STATS_PATH = '/stats'
+ARTICLES_SEPARATOR = ';'
+
+LATENCY_DISTRIBUTIONS = ('none', 'fixed', 'uniform', 'exponential', 'lognormal')
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8081
+DEFAULT_LATENCY = 'none'
+DEFAULT_LATENCY_MEAN = 0.1
+DEFAULT_LATENCY_SIGMA = 0.5
+DEFAULT_ERROR_RATE = 0.0
+DEFAULT_THROTTLE_RATE = 0.0
+DEFAULT_RATE_LIMIT = 0.0
+DEFAULT_RETRY_AFTER = 1
+DEFAULT_PRICE_DRIFT = 0.0
+DEFAULT_PRICE_DRIFT_RATE = 0.1
+DEFAULT_MISSING_RATE = 0.0
+MIN_PRICE_U = 10000
+MAX_PRICE_U = 1000000
+
+PARSER_DESCRIPTION = 'Локальный заменитель card.wb.ru.'
+SERVER_STARTED_MESSAGE = (
+    'Фейковый маркетплейс запущен на http://{host}:{port}{path}'
+)
+
+
+class FakeMarketplace:
+    """
+    Состояние фейкового маркетплейса: карточки, цены и счетчики.
+
+    Цена карточки при каждом запросе с вероятностью price_drift_rate
+    сдвигается на случайную долю не больше price_drift. Для
+    сгенерированных карточек начальная цена и наличие товара
+    (missing_rate) определяются артикулом, поэтому прогоны
+    воспроизводимы при одинаковом seed.
+    """
+
+    def __init__(
+        self,
+        latency: str = DEFAULT_LATENCY,
+        latency_mean: float = DEFAULT_LATENCY_MEAN,
+        latency_sigma: float = DEFAULT_LATENCY_SIGMA,
+        error_rate: float = DEFAULT_ERROR_RATE,
+        throttle_rate: float = DEFAULT_THROTTLE_RATE,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        retry_after: int = DEFAULT_RETRY_AFTER,
+        price_drift: float = DEFAULT_PRICE_DRIFT,
+        price_drift_rate: float = DEFAULT_PRICE_DRIFT_RATE,
+        missing_rate: float = DEFAULT_MISSING_RATE,
+        fixtures: Optional[dict[str, dict]] = None,
+        seed: Optional[int] = None
+    ) -> None:
+        self.latency = latency
+        self.latency_mean = latency_mean
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.price_drift = price_drift
+        self.price_drift_rate = price_drift_rate
+        self.missing_rate = missing_rate
+        self.cards: dict[str, dict] = dict(fixtures or dict())
+        self.random = random.Random(seed)
+        self.stats = Counter()
+        self._window = 0
+        self._window_requests = 0
+
+    def get_delay(self) -> float:
+        """Случайная задержка ответа по выбранному распределению."""
+        if self.latency == 'fixed':
+            return self.latency_mean
+        if self.latency == 'uniform':
+            return self.random.uniform(0, 2 * self.latency_mean)
+        if self.latency == 'exponential':
+            return self.random.expovariate(1 / self.latency_mean)
+        if self.latency == 'lognormal':
+            # Параметр mu подобран так, чтобы среднее равнялось latency_mean.
+            return self.random.lognormvariate(
+                math.log(self.latency_mean) - self.latency_sigma ** 2 / 2,
+                self.latency_sigma
+            )
+        return 0.0
+
+    def is_rate_limited(self) -> bool:
+        """Проверяет лимит запросов в секунду (фиксированное окно)."""
+        if not self.rate_limit:
+            return False
+        window = int(time.monotonic())
+        if window != self._window:
+            self._window = window
+            self._window_requests = 0
+        self._window_requests += 1
+        return self._window_requests > self.rate_limit
+
+    def generate_card(self, article: str) -> Optional[dict]:
+        """Генерирует карточку по артикулу или None, если товара нет."""
+        if not article.isdigit():
+            return None
+        article_random = random.Random(zlib.crc32(article.encode()))
+        if article_random.random() < self.missing_rate:
+            return None
+        sale_price_u = article_random.randrange(
+            MIN_PRICE_U, MAX_PRICE_U, 100
+        )
+        return dict(
+            id=int(article),
+            name=f'Товар {article}',
+            brand='Fake',
+            priceU=sale_price_u * 13 // 10,
+            salePriceU=sale_price_u,
+        )
+
+    def get_card(self, article: str) -> Optional[dict]:
+        """Возвращает карточку с учетом дрейфа цены."""
+        if article not in self.cards:
+            card = self.generate_card(article)
+            if card is None:
+                return None
+            self.cards[article] = card
+        card = self.cards[article]
+        if (
+            self.price_drift
+            and self.random.random() < self.price_drift_rate
+        ):
+            card['salePriceU'] = max(100, round(
+                card['salePriceU'] * (
+                    1 + self.random.uniform(
+                        -self.price_drift, self.price_drift
+                    )
+                ),
+                -2
+            ))
+            self.stats['price_changes'] += 1
+        return card
+
+    async def handle_cards(self, request: web.Request) -> web.Response:
+        """Ответ в формате card.wb.ru."""
+        self.stats['requests'] += 1
+        await asyncio.sleep(self.get_delay())
+        if (
+            self.is_rate_limited()
+            or self.random.random() < self.throttle_rate
+        ):
+            self.stats['throttled'] += 1
+            return web.json_response(
+                dict(error='too many requests'),
+                status=429,
+                headers={'Retry-After': str(self.retry_after)}
+            )
+        if self.random.random() < self.error_rate:
+            self.stats['errors'] += 1
+            return web.json_response(
+                dict(error='internal server error'), status=500
+            )
+        articles = [
+            article for article in
+            request.query.get('nm', '').split(ARTICLES_SEPARATOR)
+            if article
+        ]
+        self.stats['articles'] += len(articles)
+        products = [
+            card for card in map(self.get_card, articles)
+            if card is not None
+        ]
+        return web.json_response(dict(state=0, data=dict(products=products)))
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        """Счетчики запросов, ошибок и изменений цен."""
+        return web.json_response(dict(self.stats, cards=len(self.cards)))
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get(CARDS_PATH, self.handle_cards)
+        app.router.add_get(STATS_PATH, self.handle_stats)
+        return app
+
+
+def load_fixtures(path: str) -> dict[str, dict]:
+    """
+    Загружает карточки из JSON-файла.
+
+    Файл может быть сохраненным ответом card.wb.ru или списком карточек.
+    """
+    with open(path, encoding='utf-8') as file:
+        data = json.load(file)
+    if isinstance(data, dict):
+        data = data['data']['products']
+    return {str(card['id']): card for card in data}
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=PARSER_DESCRIPTION)
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        '--latency', choices=LATENCY_DISTRIBUTIONS, default=DEFAULT_LATENCY
+    )
+    parser.add_argument(
+        '--latency-mean', type=float, default=DEFAULT_LATENCY_MEAN,
+        help='Средняя задержка ответа, с.'
+    )
+    parser.add_argument(
+        '--latency-sigma', type=float, default=DEFAULT_LATENCY_SIGMA,
+        help='Параметр sigma для lognormal.'
+    )
+    parser.add_argument(
+        '--error-rate', type=float, default=DEFAULT_ERROR_RATE,
+        help='Доля ответов 500.'
+    )
+    parser.add_argument(
+        '--throttle-rate', type=float, default=DEFAULT_THROTTLE_RATE,
+        help='Доля ответов 429.'
+    )
+    parser.add_argument(
+        '--rate-limit', type=float, default=DEFAULT_RATE_LIMIT,
+        help='Запросов в секунду до ответов 429, 0 - без лимита.'
+    )
+    parser.add_argument(
+        '--retry-after', type=int, default=DEFAULT_RETRY_AFTER,
+        help='Значение заголовка Retry-After в ответах 429, с.'
+    )
+    parser.add_argument(
+        '--price-drift', type=float, default=DEFAULT_PRICE_DRIFT,
+        help='Максимальное относительное изменение цены за раз.'
+    )
+    parser.add_argument(
+        '--price-drift-rate', type=float, default=DEFAULT_PRICE_DRIFT_RATE,
+        help='Вероятность изменения цены карточки при запросе.'
+    )
+    parser.add_argument(
+        '--missing-rate', type=float, default=DEFAULT_MISSING_RATE,
+        help='Доля сгенерированных артикулов без товара.'
+    )
+    parser.add_argument('--fixtures', help='JSON-файл с карточками.')
+    parser.add_argument('--seed', type=int)
+    return parser
+
+
+def main() -> None:
+    arguments = get_parser().parse_args()
+    marketplace = FakeMarketplace(
+        latency=arguments.latency,
+        latency_mean=arguments.latency_mean,
+        latency_sigma=arguments.latency_sigma,
+        error_rate=arguments.error_rate,
+        throttle_rate=arguments.throttle_rate,
+        rate_limit=arguments.rate_limit,
+        retry_after=arguments.retry_after,
+        price_drift=arguments.price_drift,
+        price_drift_rate=arguments.price_drift_rate,
+        missing_rate=arguments.missing_rate,
+        fixtures=(
+            load_fixtures(arguments.fixtures) if arguments.fixtures else None
+        ),
+        seed=arguments.seed
+    )
+    print(SERVER_STARTED_MESSAGE.format(
+        host=arguments.host, port=arguments.port, path=CARDS_PATH
+    ))
+    web.run_app(
+        marketplace.create_app(),
+        host=arguments.host,
+        port=arguments.port,
+        print=None
+    )
+
+
+if __name__ == '__main__':
+    main()
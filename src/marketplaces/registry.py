@@ -0,0 +1,59 @@
+"""Модуль с реестром адаптеров маркетплейсов."""
+
+from fastapi import HTTPException, status
+
+from src.core.config import settings
+from src.core.rate_limit import marketplace_rate_limiter
+from src.database.enums import Marketplace
+from src.marketplaces.base import MarketplaceAdapter
+from src.marketplaces.wildberries import WildberriesAdapter
+
+MARKETPLACE_NOT_SUPPORTED_ERROR = (
+    'Маркетплейс {marketplace} пока не поддерживается! '
+    'Поддерживаемые маркетплейсы: {supported_marketplaces}'
+)
+
+
+class MarketplaceRegistry:
+    """Адаптеры маркетплейсов по значению Marketplace."""
+
+    def __init__(self) -> None:
+        self._adapters: dict[Marketplace, MarketplaceAdapter] = dict()
+
+    def register(self, adapter: MarketplaceAdapter) -> None:
+        """Регистрирует адаптер маркетплейса."""
+        self._adapters[adapter.marketplace] = adapter
+
+    def is_supported(self, marketplace: Marketplace) -> bool:
+        """Проверяет, есть ли адаптер для маркетплейса."""
+        return marketplace in self._adapters
+
+    def supported_marketplaces(self) -> list[Marketplace]:
+        """Возвращает маркетплейсы, для которых есть адаптер."""
+        return list(self._adapters)
+
+    def get(self, marketplace: Marketplace) -> MarketplaceAdapter:
+        """Возвращает адаптер маркетплейса или ошибку 400."""
+        if marketplace not in self._adapters:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=MARKETPLACE_NOT_SUPPORTED_ERROR.format(
+                    marketplace=marketplace,
+                    supported_marketplaces=[
+                        marketplace.value
+                        for marketplace in self.supported_marketplaces()
+                    ]
+                )
+            )
+        return self._adapters[marketplace]
+
+
+marketplace_registry = MarketplaceRegistry()
+marketplace_registry.register(
+    WildberriesAdapter(
+        batch_size=settings.wildberries_batch_size,
+        concurrency=settings.wildberries_batches_concurrency,
+        timeout=settings.wildberries_batch_timeout,
+        rate_limiter=marketplace_rate_limiter
+    )
+)
@@ -0,0 +1,59 @@
+"""Модуль с адаптером маркетплейса Wildberries."""
+
+from decimal import Decimal
+from typing import Hashable, Union
+
+from fastapi import HTTPException, status
+
+from src.core.config import settings
+from src.database.enums import Marketplace
+from src.marketplaces.base import MarketplaceAdapter
+from src.marketplaces.decoders import WildberriesCard, decode_wildberries_cards
+from src.schemas.product import ProductCreate, ProductUpdate
+
+GET_WILDBERRIES_PRODUCT_DATA_ERROR = (
+    'Ошибка при получении данных для товара {article}. '
+    'Возможно товара нет в наличии!'
+)
+
+WILDBERRIES_ARTICLES_SEPARATOR = ';'
+
+
+class WildberriesAdapter(MarketplaceAdapter):
+    """Адаптер card.wb.ru: до batch_size артикулов в одном запросе."""
+
+    marketplace = Marketplace.WILDBERRIES
+
+    def get_batch_url(self, articles: list[str]) -> str:
+        return settings.wildberries_product_card_url.format(
+            dest=settings.wildberries_dest,
+            nm_id=WILDBERRIES_ARTICLES_SEPARATOR.join(articles)
+        )
+
+    def decode_cards(self, payload: bytes) -> dict[str, WildberriesCard]:
+        return decode_wildberries_cards(payload)
+
+    def get_cache_key(self, article: str) -> Hashable:
+        """Ключ кэша карточки: маркетплейс, артикул и регион."""
+        return self.marketplace, article, settings.wildberries_dest
+
+    def get_product_data(
+        self,
+        product_schema: Union[ProductCreate, ProductUpdate],
+        card: WildberriesCard
+    ) -> Union[ProductCreate, ProductUpdate]:
+        try:
+            product_schema.current_price = Decimal(str(
+                int(card.sale_price_u) / 100
+            ))
+            if card.name is None:
+                raise ValueError
+            product_schema.title = card.name
+            return product_schema
+        except Exception:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=GET_WILDBERRIES_PRODUCT_DATA_ERROR.format(
+                    article=card.id
+                )
+            )
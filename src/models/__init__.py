@@ -1,6 +1,10 @@
 from .jwt_auth import JWTToken  # noqa
 from .media import Media  # noqa
+from .notification import NotificationSubscription  # noqa
+from .price_drop import PriceDropEvent  # noqa
 from .price_history import PriceHistory  # noqa
+from .product import Product  # noqa
+from .rate_limit import RateLimitBucket  # noqa
+from .refresh_task import RefreshTask  # noqa
 from .track import Track  # noqa
 from .user import User  # noqa
-from .user_track import UserTrack  # noqa
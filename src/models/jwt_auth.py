@@ -17,14 +17,14 @@ class JWTToken(Base):
     access_token: Mapped[str] = mapped_column(nullable=False, unique=True)
     token_type: Mapped[TokenType] = mapped_column(nullable=False)
     user_id: Mapped[int] = mapped_column(
-        ForeignKey('user.id'),
+        ForeignKey('user.id', ondelete='CASCADE'),
         unique=True,
         nullable=False
     )
     user: Mapped['User'] = relationship(
         'User',
         back_populates='jwt_token',
-        lazy='selectin'
+        lazy='raise'
     )
 
     def to_dict(self):
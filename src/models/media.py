@@ -23,7 +23,7 @@ class Media(Base):
     user: Mapped['User'] = relationship(
         'User',
         back_populates='media',
-        lazy='selectin'
+        lazy='raise'
     )
     filename: Mapped[str] = mapped_column(nullable=False)
     path: Mapped[str] = mapped_column(nullable=False)
@@ -0,0 +1,30 @@
+from sqlalchemy import BigInteger, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.annotations import int_pk
+from src.models.base import Base
+
+
+class NotificationSubscription(Base):
+    """
+    Подписка пользователя на уведомления о снижении цены.
+
+    Хранится в БД, чтобы бот мог восстановить периодические
+    проверки после перезапуска.
+    """
+
+    id: Mapped[int_pk]
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey('user.id', ondelete='CASCADE'),
+        unique=True,
+        nullable=False
+    )
+    chat_id: Mapped[int] = mapped_column(
+        BigInteger, nullable=False
+    )
+    interval: Mapped[int] = mapped_column(
+        nullable=False
+    )
+    enabled: Mapped[bool] = mapped_column(
+        default=True
+    )
@@ -0,0 +1,56 @@
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.annotations import int_pk, not_null_decimal, not_null_str
+from src.models.base import Base
+
+
+class PriceDropEvent(Base):
+    """
+    Исходящее уведомление о снижении цены товара до желаемой (outbox).
+
+    Записывается в одной транзакции с обновлением цены. При вставке
+    триггер публикует id события в канал price_drop (NOTIFY).
+    Бот отправляет уведомление и заполняет delivered_at, при ошибке
+    увеличивает attempts и переносит next_attempt_at. idempotency_key
+    не дает создать повторное уведомление об одном снижении цены.
+    """
+
+    id: Mapped[int_pk]
+    track_id: Mapped[int] = mapped_column(
+        ForeignKey('track.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey('user.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    article: Mapped[not_null_str]
+    price: Mapped[not_null_decimal]
+    idempotency_key: Mapped[str] = mapped_column(
+        unique=True, nullable=False
+    )
+    attempts: Mapped[int] = mapped_column(
+        default=0, server_default='0', nullable=False
+    )
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    last_error: Mapped[str | None] = mapped_column(nullable=True)
+    delivered_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=True
+    )
+
+    __table_args__ = (
+        Index(
+            'ix_pricedropevent_undelivered',
+            'next_attempt_at',
+            postgresql_where=delivered_at.is_(None)
+        ),
+    )
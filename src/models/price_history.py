@@ -1,7 +1,7 @@
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.annotations import int_pk
@@ -10,6 +10,8 @@ from src.models.base import Base
 if TYPE_CHECKING:
     from src.models.track import Track
 
+TRACK_ID_CREATED_AT_INDEX_NAME = 'ix_pricehistory_track_id_created_at'
+
 
 class PriceHistory(Base):
     """История цен."""
@@ -24,5 +26,9 @@ class PriceHistory(Base):
     track: Mapped['Track'] = relationship(
         'Track',
         back_populates='price_history',
-        lazy='selectin'
+        lazy='raise'
+    )
+
+    __table_args__ = (
+        Index(TRACK_ID_CREATED_AT_INDEX_NAME, 'track_id', 'created_at'),
     )
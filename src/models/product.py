@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from sqlalchemy import String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.annotations import int_pk, not_null_decimal, not_null_str
+from src.database.enums import Marketplace
+from src.models.base import Base
+
+IMAGE_URL_MAX_LENGTH = 2 ** 11
+
+UNIQUE_MARKETPLACE_ARTICLE_CONSTRAINT_NAME = 'unique_marketplace_article'
+
+
+class Product(Base):
+    """
+    Модель товара маркетплейса.
+
+    Общая для всех пользователей, отслеживающих товар: одно обновление
+    цены товара применяется сразу ко всем подпискам (Track).
+    next_check_at - время следующей проверки цены (None - проверить сразу).
+    """
+
+    id: Mapped[int_pk]
+    marketplace: Mapped[Marketplace] = mapped_column(
+        nullable=False
+    )
+    article: Mapped[not_null_str]
+    title: Mapped[not_null_str]
+    image_url: Mapped[str | None] = mapped_column(
+        String(IMAGE_URL_MAX_LENGTH),
+        nullable=True
+    )
+    current_price: Mapped[not_null_decimal]
+    last_checked_at: Mapped[datetime] = mapped_column(
+        nullable=True, default=func.now()
+    )
+    next_check_at: Mapped[datetime | None] = mapped_column(
+        nullable=True, index=True
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            'marketplace', 'article',
+            name=UNIQUE_MARKETPLACE_ARTICLE_CONSTRAINT_NAME
+        ),
+    )
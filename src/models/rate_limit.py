@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class RateLimitBucket(Base):
+    """
+    Состояние token bucket, общее для всех воркеров API.
+
+    key - ключ ограничителя (хост маркетплейса), tokens - число
+    доступных токенов на момент refilled_at.
+    """
+
+    key: Mapped[str] = mapped_column(primary_key=True)
+    tokens: Mapped[float] = mapped_column(nullable=False)
+    refilled_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, func
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.annotations import int_pk
+from src.models.base import Base
+
+
+class RefreshTask(Base):
+    """
+    Задача на обновление цены товара в очереди воркеров.
+
+    На товар приходится не больше одной задачи. Воркер, забравший
+    задачу, переносит available_at на время видимости: если он упадет,
+    задачу заберет другой воркер (at-least-once).
+    """
+
+    id: Mapped[int_pk]
+    product_id: Mapped[int] = mapped_column(
+        ForeignKey('product.id', ondelete='CASCADE'),
+        unique=True,
+        nullable=False
+    )
+    attempts: Mapped[int] = mapped_column(
+        default=0, server_default='0', nullable=False
+    )
+    available_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True
+    )
@@ -1,7 +1,9 @@
 from datetime import datetime
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String, UniqueConstraint, func
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
+from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.annotations import int_pk, not_null_decimal, not_null_str
@@ -10,35 +12,36 @@ from src.models.base import Base
 
 if TYPE_CHECKING:
     from src.models.price_history import PriceHistory
+    from src.models.product import Product
     from src.models.user import User
 
 
 URL_MAX_LENGTH = 2 ** 11
-IMAGE_URL_MAX_LENGTH = 2 ** 11
 
 UNIQUE_ARTICLE_MARKETPLACE_USER_ID_CONSTRAINT_NAME = (
     'unique_article_marketplace_user_id'
 )
+USER_ID_MARKETPLACE_INDEX_NAME = 'ix_track_user_id_marketplace'
+PRODUCT_ID_INDEX_NAME = 'ix_track_product_id'
 
 
 class Track(Base):
-    """Модель для отслеживаемого url."""
+    """
+    Модель подписки пользователя на товар.
+
+    Данные о самом товаре (название, цена, изображение) хранятся
+    в общей модели Product и доступны через одноименные атрибуты,
+    поэтому Product всегда загружается вместе с подпиской (JOIN).
+    Остальные связи не загружаются по умолчанию: нужные эндпоинту
+    связи перечисляются в options запросов CRUD.
+    """
 
     id: Mapped[int_pk]
     marketplace: Mapped[Marketplace] = mapped_column(
         nullable=False
     )
     article: Mapped[not_null_str]
-    title: Mapped[not_null_str]
-    image_url: Mapped[str | None] = mapped_column(
-        String(IMAGE_URL_MAX_LENGTH),
-        nullable=True
-    )
     target_price: Mapped[not_null_decimal]
-    current_price: Mapped[not_null_decimal]
-    last_checked_at: Mapped[datetime] = mapped_column(
-        nullable=True, default=func.now()
-    )
     is_active: Mapped[bool] = mapped_column(
         default=True
     )
@@ -53,20 +56,50 @@ class Track(Base):
     user: Mapped['User'] = relationship(
         'User',
         back_populates='tracks',
-        lazy='selectin',
+        lazy='raise',
+    )
+    product_id: Mapped[int] = mapped_column(
+        ForeignKey('product.id'), nullable=False
+    )
+    product: Mapped['Product'] = relationship(
+        'Product',
+        lazy='joined',
+        innerjoin=True
     )
     price_history: Mapped[list['PriceHistory']] = relationship(
         'PriceHistory',
         back_populates='track',
-        lazy='selectin',
-        cascade='all, delete-orphan'
+        lazy='raise',
+        cascade='all, delete-orphan',
+        passive_deletes=True
     )
 
+    title: AssociationProxy[str | None] = association_proxy(
+        'product', 'title'
+    )
+    image_url: AssociationProxy[str | None] = association_proxy(
+        'product', 'image_url'
+    )
+    current_price: AssociationProxy[Decimal] = association_proxy(
+        'product', 'current_price'
+    )
+    last_checked_at: AssociationProxy[datetime] = association_proxy(
+        'product', 'last_checked_at'
+    )
+
+    # Не хранится в БД: данные товара не удалось обновить из-за сбоя
+    # маркетплейса, и в ответе возвращается последняя известная цена.
+    stale = False
+
+    # Поиск по артикулу и маркетплейсу использует индекс
+    # уникального ограничения (article, marketplace, user_id).
     __table_args__ = (
         UniqueConstraint(
             'article', 'marketplace', 'user_id',
             name=UNIQUE_ARTICLE_MARKETPLACE_USER_ID_CONSTRAINT_NAME
         ),
+        Index(USER_ID_MARKETPLACE_INDEX_NAME, 'user_id', 'marketplace'),
+        Index(PRODUCT_ID_INDEX_NAME, 'product_id'),
     )
 
     # def to_dict(self):
@@ -47,8 +47,9 @@ class User(Base, SQLAlchemyBaseUserTable):
     tracks: Mapped[list['Track']] = relationship(
         'Track',
         back_populates='user',
-        lazy='selectin',
-        cascade="all, delete-orphan"
+        lazy='raise',
+        cascade='all, delete-orphan',
+        passive_deletes=True
     )
     is_verified: Mapped[bool] = mapped_column(
         nullable=False, default=True
@@ -57,12 +58,14 @@ class User(Base, SQLAlchemyBaseUserTable):
         'JWTToken',
         back_populates='user',
         uselist=False,
-        lazy='selectin',
-        cascade='all, delete-orphan'
+        lazy='raise',
+        cascade='all, delete-orphan',
+        passive_deletes=True
     )
     media: Mapped[list['Media']] = relationship(
         'Media',
         back_populates='user',
-        lazy='selectin',
-        cascade='all, delete-orphan'
+        lazy='raise',
+        cascade='all, delete-orphan',
+        passive_deletes=True
     )
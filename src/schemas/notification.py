@@ -0,0 +1,53 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+NOTIFICATION_SUBSCRIPTION_UPDATE_TITLE = (
+    'Pydantic-схема для сохранения подписки на уведомления.'
+)
+NOTIFICATION_SUBSCRIPTION_DB_TITLE = (
+    'Pydantic-схема для отображения подписки на уведомления.'
+)
+NOTIFICATION_SUBSCRIPTION_READ_TITLE = (
+    'Pydantic-схема подписки на уведомления с токеном пользователя.'
+)
+
+
+class NotificationSubscriptionUpdate(BaseModel):
+    """Pydantic-схема для сохранения подписки на уведомления."""
+
+    chat_id: int
+    interval: int = Field(..., gt=0)
+    enabled: bool = Field(True)
+
+    class Config:
+        title = NOTIFICATION_SUBSCRIPTION_UPDATE_TITLE
+
+
+class NotificationSubscriptionCreate(NotificationSubscriptionUpdate):
+    """Pydantic-схема для создания подписки на уведомления."""
+
+    user_id: int
+
+
+class NotificationSubscriptionDB(NotificationSubscriptionCreate):
+    """Pydantic-схема для отображения подписки на уведомления."""
+
+    id: int
+
+    class Config:
+        title = NOTIFICATION_SUBSCRIPTION_DB_TITLE
+        from_attributes = True
+
+
+class NotificationSubscriptionRead(NotificationSubscriptionDB):
+    """
+    Pydantic-схема подписки на уведомления с токеном пользователя.
+
+    access_token хранится и передается в зашифрованном виде.
+    """
+
+    access_token: Optional[str] = Field(None)
+
+    class Config:
+        title = NOTIFICATION_SUBSCRIPTION_READ_TITLE
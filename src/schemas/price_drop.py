@@ -0,0 +1,20 @@
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+PRICE_DROP_EVENT_CREATE_TITLE = (
+    'Pydantic-схема для создания события снижения цены.'
+)
+
+
+class PriceDropEventCreate(BaseModel):
+    """Pydantic-схема для создания события снижения цены."""
+
+    track_id: int
+    user_id: int
+    article: str
+    price: Decimal
+    idempotency_key: str
+
+    class Config:
+        title = PRICE_DROP_EVENT_CREATE_TITLE
@@ -0,0 +1,45 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from src.database.enums import Marketplace
+from src.models.product import IMAGE_URL_MAX_LENGTH
+
+PRODUCT_CREATE_TITLE = (
+    'Pydantic-схема для создания экземпляра Product в БД.'
+)
+PRODUCT_UPDATE_TITLE = (
+    'Pydantic-схема для обновления экземпляра Product в БД.'
+)
+
+
+class ProductCreate(BaseModel):
+    """Pydantic-схема для создания экземпляра Product в БД."""
+
+    marketplace: Marketplace
+    article: str
+    title: Optional[str] = Field(None)
+    image_url: Optional[str] = Field(
+        None, max_length=IMAGE_URL_MAX_LENGTH
+    )
+    current_price: Optional[Decimal] = Field(None)
+
+    class Config:
+        title = PRODUCT_CREATE_TITLE
+
+
+class ProductUpdate(BaseModel):
+    """Pydantic-схема для обновления экземпляра Product в БД."""
+
+    title: Optional[str] = Field(None)
+    image_url: Optional[str] = Field(
+        None, max_length=IMAGE_URL_MAX_LENGTH
+    )
+    current_price: Optional[Decimal] = Field(None)
+    last_checked_at: Optional[datetime] = Field(None)
+    next_check_at: Optional[datetime] = Field(None)
+
+    class Config:
+        title = PRODUCT_UPDATE_TITLE
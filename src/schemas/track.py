@@ -5,7 +5,7 @@ from typing import Optional
 from pydantic import BaseModel, Field, field_validator
 
 from src.database.enums import Marketplace
-from src.models.track import IMAGE_URL_MAX_LENGTH
+from src.models.product import IMAGE_URL_MAX_LENGTH
 from src.schemas.user import ShortUserRead
 
 URL_TITLE = 'URL-адрес товара'
@@ -32,6 +32,19 @@ DECIMAL_QUANTIZE = '0.00'
 DECIMAL_PLACES = 2
 
 
+def format_decimal(value: Decimal) -> Decimal:
+    """Приводит значение к Decimal с двумя знаками после запятой."""
+    try:
+        decimal_value = Decimal(str(value))
+        if 'E' in str(value).upper():
+            return Decimal(DECIMAL_ZERO)
+        return decimal_value.quantize(
+            Decimal(DECIMAL_QUANTIZE), rounding=ROUND_HALF_UP
+        )
+    except Exception:
+        return Decimal(DECIMAL_ZERO)
+
+
 class TargetAndCurrentPriceFields(BaseModel):
     """Схема для добавления полей target_price и current_price."""
 
@@ -46,15 +59,7 @@ class TargetAndCurrentPriceFields(BaseModel):
     @classmethod
     def format_decimal_fields(cls, value: Decimal) -> str:
         """Валидатор для Decimal-полей."""
-        try:
-            decimal_value = Decimal(str(value))
-            if 'E' in str(value).upper():
-                return Decimal(DECIMAL_ZERO)
-            return decimal_value.quantize(
-                Decimal(DECIMAL_QUANTIZE), rounding=ROUND_HALF_UP
-            )
-        except Exception:
-            return Decimal(DECIMAL_ZERO)
+        return format_decimal(value)
 
 
 class BaseTrack(TargetAndCurrentPriceFields):
@@ -78,6 +83,7 @@ class TrackDB(BaseTrack):
     id: Optional[int]
     user: ShortUserRead
     created_at: datetime
+    stale: bool = Field(False)
 
     class Config:
         title = TRACK_DB_TITLE
@@ -95,12 +101,34 @@ class TrackUserDataCreate(BaseModel):
         title = TRACK_CREATE_TITLE
 
 
-class TrackDBCreate(BaseTrack):
-    user_id: Optional[int] = Field(None)
+class TrackDBCreate(BaseModel):
+    """Pydantic-схема для создания подписки Track на товар Product."""
+
+    marketplace: Marketplace
+    article: str
+    target_price: Decimal
+    user_id: int
+    product_id: int
+
+
+class TrackUpdate(BaseModel):
+    """
+    Pydantic-схема для обновления экземпляра Track в БД.
 
+    Данные товара (цена, название) обновляются через Product.
+    """
 
-class TrackUpdate(BaseTrack):
-    """Pydantic-схема для обновления экземпляра Track в БД."""
+    target_price: Optional[Decimal] = Field(
+        None, decimal_places=DECIMAL_PLACES
+    )
+    is_active: Optional[bool] = Field(None)
+    notified: Optional[bool] = Field(None)
+
+    @field_validator('target_price', mode='before')
+    @classmethod
+    def format_decimal_fields(cls, value: Decimal) -> str:
+        """Валидатор для Decimal-поля."""
+        return format_decimal(value)
 
     class Config:
         title = TRACK_UPDATE_TITLE
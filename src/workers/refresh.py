@@ -0,0 +1,69 @@
+"""
+Воркер обновления цен товаров из очереди refreshtask.
+
+Запуск: python -m src.workers.refresh
+
+Каждый воркер ставит в очередь товары, цену которых пора проверить,
+забирает пачку задач (FOR UPDATE SKIP LOCKED) и обновляет товары.
+Задачи удаляются в одной транзакции с обновлением, поэтому
+незавершенная пачка будет обработана повторно после истечения
+времени видимости. Пропускная способность растет с числом воркеров.
+"""
+
+import asyncio
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.v1.utils import refresh_tracks
+from src.core.config import settings
+from src.core.http_client import marketplace_client
+from src.crud.refresh_task import refresh_task_crud
+from src.crud.track import TRACK_WITH_HISTORY_OPTIONS, track_crud
+from src.database.db import AsyncSessionLocal
+
+
+async def process_batch(session: AsyncSession) -> int:
+    """Обрабатывает одну пачку задач. Возвращает число задач."""
+    await refresh_task_crud.enqueue_due_products(session)
+    product_ids = await refresh_task_crud.claim(
+        settings.refresh_worker_batch_size,
+        settings.refresh_worker_visibility_timeout,
+        session
+    )
+    await session.commit()
+    if not product_ids:
+        return 0
+    tracks = await track_crud.get_active_tracks_by_product_ids(
+        product_ids, session, options=TRACK_WITH_HISTORY_OPTIONS
+    )
+    await refresh_task_crud.delete_by_product_ids(product_ids, session)
+    products = {track.product_id: track.product for track in tracks}
+    await refresh_tracks(tracks, session, products=list(products.values()))
+    return len(product_ids)
+
+
+async def run_worker() -> None:
+    """Обрабатывает очередь, пока процесс не будет остановлен."""
+    print(f'Воркер обновления цен запущен! Дата: {datetime.now()}')
+    await marketplace_client.start()
+    try:
+        while True:
+            try:
+                async with AsyncSessionLocal() as session:
+                    processed = await process_batch(session)
+            except Exception as error:
+                print(f'Ошибка обработки очереди: {error}')
+                processed = 0
+            if processed < settings.refresh_worker_batch_size:
+                await asyncio.sleep(settings.refresh_worker_poll_interval)
+    finally:
+        await marketplace_client.close()
+
+
+def main() -> None:
+    asyncio.run(run_worker())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,19 @@
+import os
+
+# Обязательные настройки src.core.config.Settings: модули под тестом
+# импортируют settings, но к базе данных тесты не обращаются.
+REQUIRED_SETTINGS = dict(
+    DB_DIALECT='postgresql',
+    DB_DRIVER='asyncpg',
+    SECRET='secret',
+    FIRST_SUPERUSER_EMAIL='admin@mail.ru',
+    FIRST_SUPERUSER_PASSWORD='password',
+    POSTGRES_USER='user',
+    POSTGRES_PASSWORD='password',
+    POSTGRES_DB='db',
+    POSTGRES_PORT='5432',
+    POSTGRES_HOST='localhost',
+)
+
+for name, value in REQUIRED_SETTINGS.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from src.core.cache import TTLCache
+
+TTL = 60
+MAXSIZE = 10
+
+
+def test_concurrent_misses_are_loaded_once():
+    cache = TTLCache(TTL, MAXSIZE)
+    calls = []
+
+    async def loader(keys):
+        calls.append(keys)
+        await asyncio.sleep(0.01)
+        return {key: key * 10 for key in keys}
+
+    async def main():
+        return await asyncio.gather(
+            cache.get_many_or_load([1, 2], loader),
+            cache.get_many_or_load([2, 3], loader),
+            cache.get_many_or_load([1, 2, 3], loader),
+        )
+
+    results = asyncio.run(main())
+
+    assert calls == [[1, 2], [3]]
+    assert results == [{1: 10, 2: 20}, {2: 20, 3: 30}, {1: 10, 2: 20, 3: 30}]
+    assert (cache.misses, cache.coalesced, cache.hits) == (3, 4, 0)
+
+
+def test_cached_values_are_not_reloaded():
+    cache = TTLCache(TTL, MAXSIZE)
+    calls = []
+
+    async def loader(keys):
+        calls.append(keys)
+        return {key: key for key in keys}
+
+    async def main():
+        await cache.get_many_or_load([1], loader)
+        return await cache.get_many_or_load([1, 2], loader)
+
+    assert asyncio.run(main()) == {1: 1, 2: 2}
+    assert calls == [[1], [2]]
+    assert cache.hits == 1
+
+
+def test_missing_values_are_not_cached():
+    cache = TTLCache(TTL, MAXSIZE)
+    calls = []
+
+    async def loader(keys):
+        calls.append(keys)
+        return dict()
+
+    async def main():
+        first = await cache.get_many_or_load([1], loader)
+        second = await cache.get_many_or_load([1], loader)
+        return first, second
+
+    assert asyncio.run(main()) == (dict(), dict())
+    assert calls == [[1], [1]]
+
+
+def test_loader_error_is_shared_with_waiters():
+    cache = TTLCache(TTL, MAXSIZE)
+
+    async def loader(keys):
+        await asyncio.sleep(0.01)
+        raise ValueError(keys)
+
+    async def main():
+        return await asyncio.gather(
+            cache.get_many_or_load([1], loader),
+            cache.get_many_or_load([1], loader),
+            return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert not cache._in_flight
+
+
+def test_waiters_reload_after_cancelled_load():
+    cache = TTLCache(TTL, MAXSIZE)
+    calls = []
+
+    async def slow_loader(keys):
+        calls.append(keys)
+        await asyncio.sleep(1)
+        return {key: key for key in keys}
+
+    async def loader(keys):
+        calls.append(keys)
+        return {key: -key for key in keys}
+
+    async def main():
+        owner = asyncio.create_task(cache.get_many_or_load([1], slow_loader))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_many_or_load([1], loader))
+        await asyncio.sleep(0)
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        return await waiter
+
+    assert asyncio.run(main()) == {1: -1}
+    assert calls == [[1], [1]]
+
+
+def test_expired_and_evicted_entries(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr('src.core.cache.time.monotonic', lambda: now[0])
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set(1, 'a')
+    cache.set(2, 'b')
+    cache.get(1)
+    cache.set(3, 'c')
+
+    assert cache.get(2) is None
+    assert cache.get(1) == 'a'
+
+    now[0] = 11
+    assert cache.get(1) is None
+    assert cache.get(3) is None
@@ -0,0 +1,92 @@
+import pytest
+
+from src.core.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+FAILURE_THRESHOLD = 3
+RECOVERY_TIMEOUT = 30
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(
+        'src.core.circuit_breaker.time.monotonic', lambda: now[0]
+    )
+    return now
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(FAILURE_THRESHOLD, RECOVERY_TIMEOUT)
+
+
+def open_breaker(breaker):
+    for _ in range(FAILURE_THRESHOLD):
+        breaker.record_failure()
+
+
+def test_opens_after_threshold_failures(breaker):
+    for _ in range(FAILURE_THRESHOLD - 1):
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+
+
+def test_success_resets_failures(breaker):
+    for _ in range(FAILURE_THRESHOLD - 1):
+        breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CLOSED
+
+
+def test_half_open_allows_single_probe(breaker, clock):
+    open_breaker(breaker)
+    clock[0] = RECOVERY_TIMEOUT - 1
+    assert not breaker.allow_request()
+
+    clock[0] = RECOVERY_TIMEOUT
+    assert breaker.allow_request()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow_request()
+
+
+def test_probe_success_closes(breaker, clock):
+    open_breaker(breaker)
+    clock[0] = RECOVERY_TIMEOUT
+    breaker.allow_request()
+
+    breaker.record_success()
+
+    assert breaker.state == CLOSED
+    assert breaker.allow_request()
+
+
+def test_probe_failure_reopens(breaker, clock):
+    open_breaker(breaker)
+    clock[0] = RECOVERY_TIMEOUT
+    breaker.allow_request()
+
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+    clock[0] = 2 * RECOVERY_TIMEOUT
+    assert breaker.allow_request()
+
+
+def test_released_probe_can_be_retried(breaker, clock):
+    open_breaker(breaker)
+    clock[0] = RECOVERY_TIMEOUT
+    breaker.allow_request()
+
+    breaker.release()
+
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request()
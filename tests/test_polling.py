@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.core.config import settings
+from src.core.polling import (get_check_interval, get_price_changes_interval,
+                              is_check_due)
+
+MIN_INTERVAL = 60
+MAX_INTERVAL = 6 * 60 * 60
+NEAR_TARGET_DISTANCE = 0.05
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+PRICE = Decimal('1000')
+
+
+@pytest.fixture(autouse=True)
+def polling_settings(monkeypatch):
+    monkeypatch.setattr(settings, 'polling_min_interval', MIN_INTERVAL)
+    monkeypatch.setattr(settings, 'polling_max_interval', MAX_INTERVAL)
+    monkeypatch.setattr(
+        settings, 'polling_near_target_distance', NEAR_TARGET_DISTANCE
+    )
+
+
+def at(hours: float) -> datetime:
+    return START + timedelta(hours=hours)
+
+
+def test_changes_interval_counts_unchanged_tail():
+    history = [(at(0), PRICE), (at(1), PRICE - 1)]
+
+    assert get_price_changes_interval(history, at(4)) == 2 * 60 * 60
+
+
+def test_changes_interval_without_changes_is_observed_period():
+    assert get_price_changes_interval([(at(0), PRICE)], at(3)) == 3 * 3600
+
+
+def test_changes_interval_without_history():
+    assert get_price_changes_interval([], at(3)) is None
+
+
+def test_changes_interval_accepts_naive_history():
+    history = [
+        (at(0).astimezone().replace(tzinfo=None), PRICE),
+        (at(1), PRICE + 1)
+    ]
+
+    assert get_price_changes_interval(history, at(1)) == 30 * 60
+
+
+def test_check_interval_without_history_is_minimal():
+    assert get_check_interval(
+        [], PRICE, [], at(0)
+    ) == timedelta(seconds=MIN_INTERVAL)
+
+
+def test_check_interval_of_stable_price_is_capped():
+    history = [(at(0), PRICE)]
+
+    assert get_check_interval(
+        history, PRICE, [], at(24)
+    ) == timedelta(seconds=MAX_INTERVAL)
+
+
+def test_check_interval_shrinks_near_target():
+    history = [(at(0), PRICE), (at(1), PRICE - 10)]
+    far = get_check_interval(history, PRICE, [PRICE / 2], at(4))
+    near = get_check_interval(
+        history, PRICE, [PRICE * Decimal('0.99')], at(4)
+    )
+
+    assert far == timedelta(hours=2)
+    assert near == far * 0.2
+
+
+def test_check_interval_is_not_below_minimum():
+    history = [(at(0), PRICE), (at(1), PRICE - 10)]
+
+    assert get_check_interval(
+        history, PRICE, [PRICE], at(4)
+    ) == timedelta(seconds=MIN_INTERVAL)
+
+
+def test_check_is_due():
+    assert is_check_due(None, at(0))
+    assert is_check_due(at(0), at(0))
+    assert not is_check_due(at(1), at(0))
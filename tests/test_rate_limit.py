@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from src.core.rate_limit import LocalTokenBucket
+
+RATE = 2
+CAPACITY = 3
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr('src.core.rate_limit.time.monotonic', lambda: now[0])
+    return now
+
+
+def test_reserve_waits_once_capacity_is_spent(clock):
+    bucket = LocalTokenBucket(RATE, CAPACITY)
+
+    delays = [asyncio.run(bucket.reserve()) for _ in range(CAPACITY + 2)]
+
+    assert delays == [0.0, 0.0, 0.0, 0.5, 1.0]
+
+
+def test_refill_is_capped_at_capacity(clock):
+    bucket = LocalTokenBucket(RATE, CAPACITY)
+    asyncio.run(bucket.reserve())
+    clock[0] = 100
+
+    asyncio.run(bucket.reserve())
+
+    assert bucket.tokens == CAPACITY - 1
+
+
+def test_release_returns_token_up_to_capacity(clock):
+    bucket = LocalTokenBucket(RATE, CAPACITY)
+    asyncio.run(bucket.reserve())
+
+    asyncio.run(bucket.release())
+    assert bucket.tokens == CAPACITY
+
+    asyncio.run(bucket.release())
+    assert bucket.tokens == CAPACITY
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from src.core.retry import get_backoff_delay, retry_with_backoff
+
+BASE_DELAY = 0.5
+MAX_DELAY = 4
+
+
+@pytest.mark.parametrize('attempt, upper_bound', [
+    (0, 0.5),
+    (1, 1),
+    (2, 2),
+    (3, 4),
+    (10, MAX_DELAY),
+])
+def test_backoff_delay_bounds(monkeypatch, attempt, upper_bound):
+    bounds = []
+    monkeypatch.setattr(
+        'src.core.retry.random.uniform',
+        lambda low, high: bounds.append((low, high)) or high
+    )
+
+    assert get_backoff_delay(attempt, BASE_DELAY, MAX_DELAY) == upper_bound
+    assert bounds == [(0, upper_bound)]
+
+
+def test_backoff_delay_is_within_bounds():
+    for attempt in range(10):
+        delay = get_backoff_delay(attempt, BASE_DELAY, MAX_DELAY)
+        assert 0 <= delay <= min(MAX_DELAY, BASE_DELAY * 2 ** attempt)
+
+
+def test_retry_stops_on_non_retryable_error(monkeypatch):
+    monkeypatch.setattr('src.core.retry.get_backoff_delay', lambda *_: 0)
+    calls = []
+
+    async def call():
+        calls.append(len(calls))
+        raise KeyError if len(calls) > 1 else ValueError
+
+    with pytest.raises(KeyError):
+        asyncio.run(retry_with_backoff(
+            call, 5, BASE_DELAY, MAX_DELAY,
+            lambda error: isinstance(error, ValueError)
+        ))
+    assert len(calls) == 2
+
+
+def test_retry_gives_up_after_attempts(monkeypatch):
+    monkeypatch.setattr('src.core.retry.get_backoff_delay', lambda *_: 0)
+    calls = []
+
+    async def call():
+        calls.append(len(calls))
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        asyncio.run(retry_with_backoff(
+            call, 3, BASE_DELAY, MAX_DELAY, lambda error: True
+        ))
+    assert len(calls) == 3